@@ -2,74 +2,209 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from flask import Flask, jsonify, request
+import orjson
+from flask import Flask, Response, current_app, jsonify, request
 from flask_cors import CORS
 
 from common.exceptions import PersistenceError, RecordNotFoundError, ValidationError
+from common.models import Category, Expense, Income, format_cents
 from common.services import CategoryService, ExpenseService, IncomeService, LedgerService
 from common.storage import JSONStorage
 
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def _format_amount(value: Decimal) -> str:
+    # Route through integer cents; int formatting is far cheaper than Decimal.__format__.
+    return format_cents(int(value.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP)))
+
+
+def _encode_default(obj: Any) -> Any:
+    """Serialise domain objects inline so list responses skip an intermediate list of dicts."""
+    if isinstance(obj, (Expense, Income)):
+        # Records cache their own encoded bytes; splice them in rather than re-encoding.
+        return orjson.Fragment(obj.to_json())
+    if isinstance(obj, Category):
+        return obj.to_dict()
+    if isinstance(obj, Decimal):
+        return _format_amount(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serialisable")
+
+
+def _dumps(payload: Any) -> bytes:
+    # orjson encodes the to_dict payloads far faster than flask.jsonify's stdlib json.
+    return orjson.dumps(payload, default=_encode_default, option=_DUMPS_OPTIONS)
+
+
+def _success(payload: Any, status: int = 200):
+    if status == 204:
+        return ("", status)
+    return Response(_dumps(payload), status=status, mimetype="application/json")
+
+
+def _make_error_handler(status: int, message: str) -> Callable[[Exception], Any]:
+    def handle(exc: Exception):
+        current_app.logger.error("%s: %s", message, exc)
+        return jsonify({"error": message, "details": str(exc)}), status
+
+    return handle
+
+
+# Built once at import so every app created by the factory shares the same handlers.
+_ERROR_HANDLERS = (
+    (ValidationError, _make_error_handler(400, "Validation error")),
+    (RecordNotFoundError, _make_error_handler(404, "Record not found")),
+    (PersistenceError, _make_error_handler(500, "Persistence error")),
+)
+
+
+def _json_body() -> Dict[str, Any]:
+    req = request._get_current_object()  # resolve the LocalProxy once per call
+    # Same rule as request.is_json, applied to the raw header without werkzeug's full MIME parse.
+    mimetype = req.environ.get("CONTENT_TYPE", "").partition(";")[0].strip().lower()
+    if mimetype != "application/json" and not (
+        mimetype.startswith("application/") and mimetype.endswith("+json")
+    ):
+        raise ValidationError("Request content must be application/json")
+    raw = req.get_data(cache=False)
+    if not raw:
+        raise ValidationError("Malformed JSON body")
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
+        raise ValidationError("Malformed JSON body") from exc
+    if data is None:
+        raise ValidationError("Malformed JSON body")
+    return data
+
+
+def _filter_reader(*keys: str) -> Callable[[], Dict[str, str]]:
+    # Filter keys are fixed per endpoint, so bind them once instead of rebuilding a dict per request.
+    def read() -> Dict[str, str]:
+        get = request.args.get
+        applied: Dict[str, str] = {}
+        for key in keys:
+            value = get(key)
+            if value:
+                applied[key] = value
+        return applied
+
+    return read
+
+
+_expense_filters = _filter_reader("category", "payment_method", "tag", "merchant", "start", "end")
+_income_filters = _filter_reader("source", "received_method", "tag", "start", "end")
+_summary_filters = _filter_reader("start", "end", "category", "source", "tag")
+
+
+def _install_cors(app: Flask, origins: Optional[List[str]]) -> None:
+    """Attach CORS headers precomputed from the fixed origin configuration.
+
+    ``origins=None`` allows any origin; otherwise only the listed origins are echoed back
+    (with credentials), mirroring the previous flask_cors production setup. Only genuine
+    preflights on known routes are answered here; other OPTIONS requests reach Flask as usual.
+    """
+    allow_methods = {"Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS"}
+    if origins is None:
+        simple_headers = {"Access-Control-Allow-Origin": "*"}
+        preflight_headers = {**simple_headers, **allow_methods}
+
+        def headers_for(origin: Optional[str], preflight: bool) -> Optional[Dict[str, str]]:
+            return preflight_headers if preflight else simple_headers
+
+    else:
+        allowed = frozenset(origins)
+        credentialed = {"Access-Control-Allow-Credentials": "true"}
+        preflight_credentialed = {**credentialed, **allow_methods}
+
+        def headers_for(origin: Optional[str], preflight: bool) -> Optional[Dict[str, str]]:
+            if origin not in allowed:
+                return None
+            base = preflight_credentialed if preflight else credentialed
+            return {**base, "Access-Control-Allow-Origin": origin}
+
+    # Echoed origins make every response depend on the Origin header.
+    vary_origin = origins is not None
+
+    def add_headers(response: Response, headers: Optional[Dict[str, str]]) -> Response:
+        if headers:
+            response.headers.update(headers)
+        if vary_origin:
+            response.vary.add("Origin")
+        return response
+
+    @app.before_request
+    def answer_preflight():
+        req = request._get_current_object()
+        environ = req.environ
+        if (
+            req.method != "OPTIONS"
+            or "HTTP_ACCESS_CONTROL_REQUEST_METHOD" not in environ
+            or req.url_rule is None
+        ):
+            return None
+        response = add_headers(Response(status=204), headers_for(req.origin, True))
+        requested_headers = environ.get("HTTP_ACCESS_CONTROL_REQUEST_HEADERS")
+        if requested_headers and "Access-Control-Allow-Origin" in response.headers:
+            # Any request header is allowed, as it was under flask_cors; echo what was asked for.
+            response.headers["Access-Control-Allow-Headers"] = requested_headers
+        return response
+
+    @app.after_request
+    def add_cors_headers(response: Response) -> Response:
+        return add_headers(response, headers_for(request.origin, False))
+
 
 def create_app(data_dir: Optional[Path] = None) -> Flask:
     app = Flask(__name__)
 
     env_name = os.getenv("EXPENSE_TRACKER_ENV", "prod").lower()
-    if env_name in {"dev", "development"}:
+    debug = env_name in {"dev", "development"}
+    if debug:
         CORS(app, resources={r"/*": {"origins": "*"}}, supports_credentials=True)
     else:
+        # Production origins are fixed at startup, so skip flask_cors' per-request matching.
         allowed_origins = os.getenv("EXPENSE_TRACKER_ALLOWED_ORIGINS")
         if allowed_origins:
             origins = [origin.strip() for origin in allowed_origins.split(",") if origin.strip()]
-            CORS(app, resources={r"/*": {"origins": origins}}, supports_credentials=True)
+            _install_cors(app, origins)
         else:
-            CORS(app)
+            _install_cors(app, None)
 
-    storage = JSONStorage(Path(data_dir or "data"))
+    # Development keeps the data files indented for inspection; production writes them compactly.
+    storage = JSONStorage(Path(data_dir or "data"), indent=debug)
     category_service = CategoryService(storage)
     expense_service = ExpenseService(storage)
     income_service = IncomeService(storage)
     ledger = LedgerService(expense_service, income_service)
 
-    def _success(payload: Any, status: int = 200):
-        if status == 204:
-            return ("", status)
-        return jsonify(payload), status
-
-    def _handle_error(exc: Exception, status: int, message: str):
-        app.logger.error("%s: %s", message, exc)
-        return jsonify({"error": message, "details": str(exc)}), status
-
-    @app.errorhandler(ValidationError)
-    def handle_validation_error(exc: ValidationError):
-        return _handle_error(exc, 400, "Validation error")
+    for exc_class, handler in _ERROR_HANDLERS:
+        app.register_error_handler(exc_class, handler)
 
-    @app.errorhandler(RecordNotFoundError)
-    def handle_not_found(exc: RecordNotFoundError):
-        return _handle_error(exc, 404, "Record not found")
-
-    @app.errorhandler(PersistenceError)
-    def handle_persistence_error(exc: PersistenceError):
-        return _handle_error(exc, 500, "Persistence error")
-
-    def _json_body() -> Dict[str, Any]:
-        if not request.is_json:
-            raise ValidationError("Request content must be application/json")
-        data = request.get_json(silent=True)
-        if data is None:
-            raise ValidationError("Malformed JSON body")
-        return data
-
-    def _clean_filters(raw: Dict[str, Optional[str]]) -> Dict[str, str]:
-        return {k: v for k, v in raw.items() if v not in (None, "")}
+    # (revision, body, etag) of the last serialised category list; rebuilt only after mutations.
+    category_cache: Tuple[int, bytes, str] = (-1, b"", "")
 
     @app.get("/categories")
     def list_categories():
-        categories = category_service.list()
-        return _success({"items": [category.to_dict() for category in categories]})
+        nonlocal category_cache
+        revision, body, etag = category_cache
+        if revision != category_service.revision:
+            revision = category_service.revision
+            body = _dumps({"items": category_service.list()})
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            category_cache = (revision, body, etag)
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype="application/json")
+        response.set_etag(etag, weak=True)
+        return response
 
     @app.post("/categories")
     def create_category():
@@ -77,39 +212,28 @@ def create_app(data_dir: Optional[Path] = None) -> Flask:
         category = category_service.add(payload)
         return _success(category.to_dict(), 201)
 
-    @app.put("/categories/<category_id>")
-    def update_category(category_id: str):
+    # Item routes share one URL rule per resource and dispatch on the method, keeping the map small.
+    @app.route("/categories/<category_id>", methods=["PUT", "DELETE"])
+    def category_item(category_id: str):
         existing = category_service.get(category_id)
-        payload = _json_body()
-        category = category_service.update(category_id, payload)
-        if existing.name != category.name:
-            expense_service.rename_category(existing.name, category.name)
-        return _success(category.to_dict())
-
-    @app.delete("/categories/<category_id>")
-    def delete_category(category_id: str):
-        category = category_service.get(category_id)
-        if expense_service.is_category_in_use(category.name):
+        if request.method == "PUT":
+            payload = _json_body()
+            category = category_service.update(category_id, payload)
+            if existing.name != category.name:
+                expense_service.rename_category(existing.name, category.name)
+            return _success(category.to_dict())
+        if expense_service.is_category_in_use(existing.name):
             raise ValidationError("Cannot delete a category that is in use by expenses")
         category_service.delete(category_id)
         return _success({}, 204)
 
     @app.get("/expenses")
     def list_expenses():
-        filters = {
-            "category": request.args.get("category"),
-            "payment_method": request.args.get("payment_method"),
-            "tag": request.args.get("tag"),
-            "merchant": request.args.get("merchant"),
-            "start": request.args.get("start"),
-            "end": request.args.get("end"),
-        }
-        applied = _clean_filters(filters)
-        expenses = expense_service.list(**applied)
-        total = expense_service.total(**applied)
+        applied = _expense_filters()
+        expenses, total = expense_service.list_with_total(**applied)
         return _success({
-            "items": [expense.to_dict() for expense in expenses],
-            "total": f"{total:.2f}",
+            "items": expenses,
+            "total": _format_amount(total),
         })
 
     @app.post("/expenses")
@@ -118,37 +242,25 @@ def create_app(data_dir: Optional[Path] = None) -> Flask:
         expense = expense_service.add(payload)
         return _success(expense.to_dict(), 201)
 
-    @app.get("/expenses/<expense_id>")
-    def get_expense(expense_id: str):
-        expense = expense_service.get(expense_id)
-        return _success(expense.to_dict())
-
-    @app.put("/expenses/<expense_id>")
-    def update_expense(expense_id: str):
-        payload = _json_body()
-        expense = expense_service.update(expense_id, payload)
-        return _success(expense.to_dict())
-
-    @app.delete("/expenses/<expense_id>")
-    def delete_expense(expense_id: str):
+    @app.route("/expenses/<expense_id>", methods=["GET", "PUT", "DELETE"])
+    def expense_item(expense_id: str):
+        method = request.method
+        if method == "GET":
+            return _success(expense_service.get(expense_id).to_dict())
+        if method == "PUT":
+            payload = _json_body()
+            expense = expense_service.update(expense_id, payload)
+            return _success(expense.to_dict())
         expense_service.delete(expense_id)
         return _success({}, 204)
 
     @app.get("/incomes")
     def list_incomes():
-        filters = {
-            "source": request.args.get("source"),
-            "received_method": request.args.get("received_method"),
-            "tag": request.args.get("tag"),
-            "start": request.args.get("start"),
-            "end": request.args.get("end"),
-        }
-        applied = _clean_filters(filters)
-        incomes = income_service.list(**applied)
-        total = income_service.total(**applied)
+        applied = _income_filters()
+        incomes, total = income_service.list_with_total(**applied)
         return _success({
-            "items": [income.to_dict() for income in incomes],
-            "total": f"{total:.2f}",
+            "items": incomes,
+            "total": _format_amount(total),
         })
 
     @app.post("/incomes")
@@ -157,33 +269,22 @@ def create_app(data_dir: Optional[Path] = None) -> Flask:
         income = income_service.add(payload)
         return _success(income.to_dict(), 201)
 
-    @app.get("/incomes/<income_id>")
-    def get_income(income_id: str):
-        income = income_service.get(income_id)
-        return _success(income.to_dict())
-
-    @app.put("/incomes/<income_id>")
-    def update_income(income_id: str):
-        payload = _json_body()
-        income = income_service.update(income_id, payload)
-        return _success(income.to_dict())
-
-    @app.delete("/incomes/<income_id>")
-    def delete_income(income_id: str):
+    @app.route("/incomes/<income_id>", methods=["GET", "PUT", "DELETE"])
+    def income_item(income_id: str):
+        method = request.method
+        if method == "GET":
+            return _success(income_service.get(income_id).to_dict())
+        if method == "PUT":
+            payload = _json_body()
+            income = income_service.update(income_id, payload)
+            return _success(income.to_dict())
         income_service.delete(income_id)
         return _success({}, 204)
 
     @app.get("/summary")
     def summary():
-        filters = {
-            "start": request.args.get("start"),
-            "end": request.args.get("end"),
-            "category": request.args.get("category"),
-            "source": request.args.get("source"),
-            "tag": request.args.get("tag"),
-        }
-        applied = _clean_filters(filters)
+        applied = _summary_filters()
         balance = ledger.balance(**applied)
-        return _success({"balance": f"{balance:.2f}"})
+        return _success({"balance": _format_amount(balance)})
 
     return app
@@ -1,10 +1,28 @@
 """Core business logic package for the expense tracker."""
 
-from .models import Category, Expense, Income
-from .services import CategoryService, ExpenseService, IncomeService, LedgerService
-from .storage import JSONStorage
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import PersistenceError, ValidationError, RecordNotFoundError
 
+if TYPE_CHECKING:
+    from .models import Category, Expense, Income
+    from .services import CategoryService, ExpenseService, IncomeService, LedgerService
+    from .storage import JSONStorage
+
+# Models, services and storage pull in orjson and the validators; load them on first access
+# so importing ``common.exceptions`` (the CLI error paths) stays cheap.
+_LAZY_EXPORTS = {
+    "Category": ".models",
+    "Expense": ".models",
+    "Income": ".models",
+    "CategoryService": ".services",
+    "ExpenseService": ".services",
+    "IncomeService": ".services",
+    "LedgerService": ".services",
+    "JSONStorage": ".storage",
+}
+
 __all__ = [
     "Category",
     "Expense",
@@ -18,3 +36,12 @@ __all__ = [
     "ValidationError",
     "RecordNotFoundError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Optional, Tuple
 
-__all__ = ["Category", "Expense", "Income", "isoformat_utc", "parse_datetime"]
+import orjson
+
+__all__ = [
+    "Category",
+    "Expense",
+    "Income",
+    "cents_to_decimal",
+    "format_cents",
+    "isoformat_utc",
+    "parse_cents",
+    "parse_datetime",
+]
 
 
 def isoformat_utc(dt: datetime) -> str:
     """Return an ISO 8601 string with trailing Z for UTC-aware datetimes."""
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    else:
+    elif dt.tzinfo is not timezone.utc:
         dt = dt.astimezone(timezone.utc)
     iso = dt.isoformat(timespec="seconds")
     # datetime.isoformat renders +00:00 for UTC; replace with the shorter Z form.
@@ -23,6 +35,10 @@ def isoformat_utc(dt: datetime) -> str:
 
 def parse_datetime(value: str) -> datetime:
     """Parse ISO 8601 datetime strings with optional trailing Z into UTC-aware datetime."""
+    # Fast path for the exact YYYY-MM-DDTHH:MM:SSZ shape that isoformat_utc writes to storage;
+    # fromisoformat understands the Z suffix on Python 3.11+ and already yields a UTC datetime.
+    if len(value) == 20 and value[19] == "Z" and value[10] == "T":
+        return datetime.fromisoformat(value)
     value = value.strip()
     if value.endswith("Z"):
         value = value[:-1] + "+00:00"
@@ -33,10 +49,36 @@ def parse_datetime(value: str) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
-@dataclass(frozen=True)
+def parse_cents(value: object) -> int:
+    """Convert a decimal amount (e.g. ``"12.34"``) into an integer number of cents."""
+    text = str(value).strip()
+    whole, sep, frac = text.partition(".")
+    # Amounts written by to_dict always carry two fraction digits; split them without Decimal.
+    if sep and len(frac) == 2 and whole.isdecimal() and frac.isdecimal():
+        return int(whole) * 100 + int(frac)
+    return int(Decimal(text).scaleb(2).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def format_cents(cents: int) -> str:
+    """Render integer cents as a plain two-decimal string such as ``"-12.05"``."""
+    whole, frac = divmod(abs(cents), 100)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{whole}.{frac:02d}"
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Return a two-decimal Decimal view of integer cents."""
+    return Decimal(cents).scaleb(-2)
+
+
+@dataclass(frozen=True, slots=True)
 class Category:
     id: str
     name: str
+    _name_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_name_lc", self.name.lower())
 
     def to_dict(self) -> Dict[str, Any]:
         return {"id": self.id, "name": self.name}
@@ -46,10 +88,10 @@ class Category:
         return cls(id=data["id"], name=data["name"])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Expense:
     id: str
-    amount: Decimal
+    amount_cents: int
     currency: str
     category: str
     payment_method: str
@@ -57,14 +99,45 @@ class Expense:
     recorded_at: datetime
     description: Optional[str] = None
     merchant: Optional[str] = None
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     receipt_image_path: Optional[str] = None
+    # Interned lowercase keys so service filters compare strings without re-lowering per record.
+    _category_lc: str = field(init=False, repr=False, compare=False)
+    _merchant_lc: str = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_category_lc", sys.intern(self.category.lower()))
+        object.__setattr__(self, "_merchant_lc", sys.intern((self.merchant or "").lower()))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialise the expense to JSON-friendly natives."""
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._build_dict()
+            # Instances are immutable, so the serialised form never needs invalidating.
+            object.__setattr__(self, "_dict_cache", cached)
+        return dict(cached)
+
+    def to_json(self) -> bytes:
+        """Return the compact JSON encoding of to_dict(), cached alongside it."""
+        cached = self._json_cache
+        if cached is None:
+            cached = orjson.dumps(self.to_dict())
+            object.__setattr__(self, "_json_cache", cached)
+        return cached
+
+    @property
+    def amount(self) -> Decimal:
+        return cents_to_decimal(self.amount_cents)
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
-            "amount": f"{self.amount:.2f}",
+            "amount": format_cents(self.amount_cents),
             "currency": self.currency,
             "category": self.category,
             "payment_method": self.payment_method,
@@ -72,7 +145,7 @@ class Expense:
             "recorded_at": isoformat_utc(self.recorded_at),
             "description": self.description,
             "merchant": self.merchant,
-            "tags": list(self.tags),
+            "tags": self.tags,
             "receipt_image_path": self.receipt_image_path,
         }
 
@@ -81,44 +154,72 @@ class Expense:
         """Hydrate an Expense from JSON-native data."""
         return cls(
             id=data["id"],
-            amount=Decimal(str(data["amount"])),
-            currency=data["currency"],
-            category=data["category"],
-            payment_method=data["payment_method"],
+            amount_cents=parse_cents(data["amount"]),
+            # Low-cardinality fields are interned so records share one string per distinct value.
+            currency=sys.intern(data["currency"]),
+            category=sys.intern(data["category"]),
+            payment_method=sys.intern(data["payment_method"]),
             incurred_at=parse_datetime(data["incurred_at"]),
             recorded_at=parse_datetime(data["recorded_at"]),
             description=data.get("description"),
             merchant=data.get("merchant"),
-            tags=list(data.get("tags", [])),
+            tags=tuple(data.get("tags", ())),
             receipt_image_path=data.get("receipt_image_path"),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Income:
     id: str
-    amount: Decimal
+    amount_cents: int
     currency: str
     source: str
     received_method: str
     received_at: datetime
     recorded_at: datetime
     description: Optional[str] = None
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     attachment_path: Optional[str] = None
+    _source_lc: str = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_source_lc", sys.intern(self.source.lower()))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialise the income to JSON-friendly natives."""
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        return dict(cached)
+
+    def to_json(self) -> bytes:
+        """Return the compact JSON encoding of to_dict(), cached alongside it."""
+        cached = self._json_cache
+        if cached is None:
+            cached = orjson.dumps(self.to_dict())
+            object.__setattr__(self, "_json_cache", cached)
+        return cached
+
+    @property
+    def amount(self) -> Decimal:
+        return cents_to_decimal(self.amount_cents)
+
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
-            "amount": f"{self.amount:.2f}",
+            "amount": format_cents(self.amount_cents),
             "currency": self.currency,
             "source": self.source,
             "received_method": self.received_method,
             "received_at": isoformat_utc(self.received_at),
             "recorded_at": isoformat_utc(self.recorded_at),
             "description": self.description,
-            "tags": list(self.tags),
+            "tags": self.tags,
             "attachment_path": self.attachment_path,
         }
 
@@ -127,13 +228,13 @@ class Income:
         """Hydrate an Income from JSON-native data."""
         return cls(
             id=data["id"],
-            amount=Decimal(str(data["amount"])),
-            currency=data["currency"],
-            source=data["source"],
-            received_method=data["received_method"],
+            amount_cents=parse_cents(data["amount"]),
+            currency=sys.intern(data["currency"]),
+            source=sys.intern(data["source"]),
+            received_method=sys.intern(data["received_method"]),
             received_at=parse_datetime(data["received_at"]),
             recorded_at=parse_datetime(data["recorded_at"]),
             description=data.get("description"),
-            tags=list(data.get("tags", [])),
+            tags=tuple(data.get("tags", ())),
             attachment_path=data.get("attachment_path"),
         )
@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+import sys
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from itertools import accumulate, count
+from dataclasses import replace
+from functools import lru_cache
 from datetime import datetime, timezone
 from decimal import Decimal
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from operator import attrgetter
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import uuid4
 
 from .exceptions import PersistenceError, RecordNotFoundError, ValidationError
-from .models import Category, Expense, Income
+from .models import Category, Expense, Income, cents_to_decimal
 from .storage import JSONStorage
 from .validators import (
     INCOME_METHODS,
     PAYMENT_METHODS,
     ensure_recorded_after,
     normalize_tags,
-    parse_amount,
+    parse_amount_cents,
     validate_currency,
     validate_datetime,
     validate_enum,
@@ -25,64 +44,227 @@ from .validators import (
     validate_required_str,
 )
 
-
-class CategoryService:
-    """Manages expense categories and persistence."""
-
-    def __init__(self, storage: JSONStorage, resource: str = "categories.json") -> None:
+M = TypeVar("M", Category, Expense, Income)
+
+_DATE_FILTER_KEYS = ("start", "end")
+_name_lc = attrgetter("_name_lc")
+
+# (group key, start, end, residual record checks) derived from one set of raw filter values.
+_CompiledFilters = Tuple[
+    Optional[str], Optional[datetime], Optional[datetime], Tuple[Callable[[object], bool], ...]
+]
+
+
+def _normalised_filter(value: object) -> Optional[str]:
+    return None if value is None else sys.intern(str(value).strip().lower())
+
+
+def _datetime_filter(value: object, field: str) -> Optional[datetime]:
+    return None if value is None else validate_datetime(value, field)
+
+
+# Dashboards and the UI repeat the same queries, so each distinct set of raw filter values is
+# normalised, parsed and turned into record checks once. Only the active checks are kept, so no
+# record pays for a filter that was not requested.
+@lru_cache(maxsize=256)
+def _compile_expense_filters(
+    category: object,
+    payment_method: object,
+    tag: object,
+    start: object,
+    end: object,
+    merchant: object,
+) -> _CompiledFilters:
+    method = _normalised_filter(payment_method)
+    tag_lc = _normalised_filter(tag)
+    merchant_lc = _normalised_filter(merchant)
+    checks: List[Callable[[Expense], bool]] = []
+    if method:
+        checks.append(lambda expense: expense.payment_method == method)
+    if tag_lc:
+        checks.append(lambda expense: tag_lc in expense.tags)
+    if merchant_lc:
+        checks.append(lambda expense: expense._merchant_lc == merchant_lc)
+    return (
+        _normalised_filter(category),
+        _datetime_filter(start, "start"),
+        _datetime_filter(end, "end"),
+        tuple(checks),
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_income_filters(
+    source: object, received_method: object, tag: object, start: object, end: object
+) -> _CompiledFilters:
+    method = _normalised_filter(received_method)
+    tag_lc = _normalised_filter(tag)
+    checks: List[Callable[[Income], bool]] = []
+    if method:
+        checks.append(lambda income: income.received_method == method)
+    if tag_lc:
+        checks.append(lambda income: tag_lc in income.tags)
+    return (
+        _normalised_filter(source),
+        _datetime_filter(start, "start"),
+        _datetime_filter(end, "end"),
+        tuple(checks),
+    )
+
+
+class Repository(ABC, Generic[M]):
+    """Storage-backed record store shared by the category, expense and income services.
+
+    Subclasses name their model and provide ``_validate_payload``; the ``_index`` and
+    ``_unindex`` hooks let them maintain derived views as records come and go.
+    """
+
+    _model: Type[M]
+    _label: str
+    _plural: str
+
+    def __init__(self, storage: JSONStorage, resource: str) -> None:
         self._storage = storage
         self._resource = resource
-        self._categories: Dict[str, Category] = {}
-        self.load()
-
-    def add(self, payload: Dict[str, object]) -> Category:
-        data = self._validate_payload(payload)
-        category = Category(**data)
-        self._categories[category.id] = category
-        self._persist()
-        return category
-
-    def update(self, category_id: str, changes: Dict[str, object]) -> Category:
-        existing = self._get_or_raise(category_id)
-        merged_payload = {**existing.to_dict(), **changes}
-        data = self._validate_payload(merged_payload, current=existing)
-        updated = Category(**data)
-        self._categories[category_id] = updated
-        self._persist()
-        return updated
-
-    def delete(self, category_id: str) -> None:
-        self._get_or_raise(category_id)
-        del self._categories[category_id]
-        self._persist()
-
-    def get(self, category_id: str) -> Category:
-        return self._get_or_raise(category_id)
+        self._records: Dict[str, M] = {}
+        self._revision = 0
+        self.load()  # Hydrate in-memory cache from persistence on construction.
 
-    def list(self) -> List[Category]:
-        return sorted(self._categories.values(), key=lambda cat: cat.name.lower())
+    # Public API -----------------------------------------------------------
+    def add(self, payload: Dict[str, object]) -> M:
+        with self._storage.lock(self._resource):
+            data = self._validate_payload(payload)
+            record = self._model(**data)
+            self._records[record.id] = record
+            self._index(record)
+            self._changed()
+            self._log_change(record.id, record)
+            return record
+
+    def update(self, record_id: str, changes: Dict[str, object]) -> M:
+        with self._storage.lock(self._resource):
+            existing = self._get_or_raise(record_id)
+            updated = self._apply_changes(existing, changes)
+            self._records[record_id] = updated
+            self._unindex(existing)
+            self._index(updated)
+            self._changed()
+            self._log_change(record_id, updated)
+            return updated
+
+    def delete(self, record_id: str) -> None:
+        with self._storage.lock(self._resource):
+            existing = self._get_or_raise(record_id)
+            del self._records[record_id]
+            self._unindex(existing)
+            self._changed()
+            self._log_change(record_id)
+
+    def get(self, record_id: str) -> M:
+        """Return a record or raise if it does not exist."""
+        return self._get_or_raise(record_id)
 
     def load(self) -> None:
+        """Load existing records from persistence."""
         raw_records = self._storage.load(self._resource)
-        self._categories = {
-            payload["id"]: Category.from_dict(payload) for payload in raw_records
+        self._records = {
+            payload["id"]: self._model.from_dict(payload) for payload in raw_records
         }
+        self._reset_index()
+        for record in self._records.values():
+            self._index(record)
+        self._changed()
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change so callers can cache derived views of the records."""
+        return self._revision
+
+    @property
+    def storage(self) -> JSONStorage:
+        return self._storage
+
+    # Internal helpers -----------------------------------------------------
+    @abstractmethod
+    def _validate_payload(
+        self, payload: Dict[str, object], *, current: Optional[M] = None
+    ) -> Dict[str, object]:
+        """Return the model fields for ``payload``, merged over ``current`` when updating."""
+
+    def _apply_changes(self, existing: M, changes: Dict[str, object]) -> M:
+        # Merge existing serialised data with incoming changes to support partial updates.
+        merged_payload = {**existing.to_dict(), **changes}
+        return self._model(**self._validate_payload(merged_payload, current=existing))
+
+    def _changed(self) -> None:
+        self._revision += 1
+
+    def _reset_index(self) -> None:
+        """Drop derived views before ``load`` re-indexes every record."""
+
+    def _index(self, record: M) -> None:
+        """Add ``record`` to derived views; called with the resource lock held."""
+
+    def _unindex(self, record: M) -> None:
+        """Remove ``record`` from derived views; called with the resource lock held."""
 
     def _persist(self) -> None:
         try:
-            self._storage.save(
-                self._resource, [category.to_dict() for category in self._categories.values()]
-            )
+            # Persist current snapshot lazily; storage materialises it now or at batch flush.
+            self._storage.save(self._resource, self._snapshot())
+        except PersistenceError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive guard
+            raise PersistenceError(f"Unexpected error while saving {self._plural}") from exc
+
+    def _snapshot(self) -> Iterator[Dict[str, object]]:
+        # A generator body runs on first use, so the records are read as of the flush, not the save.
+        for record in self._records.values():
+            yield record.to_dict()
+
+    def _log_change(self, record_id: str, record: Optional[M] = None) -> None:
+        # Single-record changes go to the storage change log instead of rewriting every record.
+        try:
+            if record is None:
+                self._storage.tombstone(self._resource, record_id)
+            else:
+                self._storage.append(self._resource, record.to_dict())
         except PersistenceError:
             raise
         except Exception as exc:  # pragma: no cover - defensive guard
-            raise PersistenceError("Unexpected error while saving categories") from exc
+            raise PersistenceError(f"Unexpected error while saving {self._plural}") from exc
 
-    def _get_or_raise(self, category_id: str) -> Category:
+    def _get_or_raise(self, record_id: str) -> M:
         try:
-            return self._categories[category_id]
+            return self._records[record_id]
         except KeyError as exc:
-            raise RecordNotFoundError(f"Category {category_id} not found") from exc
+            raise RecordNotFoundError(f"{self._label} {record_id} not found") from exc
+
+
+class CategoryService(Repository[Category]):
+    """Manages expense categories and persistence."""
+
+    _model = Category
+    _label = "Category"
+    _plural = "categories"
+
+    def __init__(self, storage: JSONStorage, resource: str = "categories.json") -> None:
+        self._sorted: Optional[Tuple[Category, ...]] = None
+        super().__init__(storage, resource)
+
+    def list(self) -> List[Category]:
+        # Categories change rarely but are listed on every refresh, so keep the sorted view.
+        ordered = self._sorted
+        if ordered is None:
+            with self._storage.lock(self._resource):
+                ordered = self._sorted
+                if ordered is None:
+                    ordered = self._sorted = tuple(sorted(self._records.values(), key=_name_lc))
+        return list(ordered)
+
+    def _changed(self) -> None:
+        super()._changed()
+        self._sorted = None
 
     def _validate_payload(
         self, payload: Dict[str, object], *, current: Optional[Category] = None
@@ -90,10 +272,10 @@ class CategoryService:
         name = validate_required_str(payload.get("name"), "name", 50)
         canonical = name.lower()
 
-        for category in self._categories.values():
+        for category in self._records.values():
             if current and category.id == current.id:
                 continue
-            if category.name.lower() == canonical:
+            if category._name_lc == canonical:
                 raise ValidationError("Category name must be unique")
 
         return {
@@ -102,317 +284,319 @@ class CategoryService:
         }
 
 
-class ExpenseService:
-    """Manages expense records and mediates persistence."""
-
-    def __init__(self, storage: JSONStorage, resource: str = "expenses.json") -> None:
-        self._storage = storage
-        self._resource = resource
-        self._expenses: Dict[str, Expense] = {}
-        self.load()  # Hydrate in-memory cache from persistence on construction.
-
-    # Public API -----------------------------------------------------------
-    def add(self, payload: Dict[str, object]) -> Expense:
-        data = self._validate_payload(payload)
-        expense = Expense(**data)
-        self._expenses[expense.id] = expense
-        self._persist()
-        return expense
-
-    def update(self, expense_id: str, changes: Dict[str, object]) -> Expense:
-        existing = self._get_or_raise(expense_id)
-        # Merge existing serialised data with incoming changes to support partial updates.
-        merged_payload = {**existing.to_dict(), **changes}
-        data = self._validate_payload(merged_payload, current=existing)
-        updated = Expense(**data)
-        self._expenses[expense_id] = updated
-        self._persist()
-        return updated
-
-    def delete(self, expense_id: str) -> None:
-        self._get_or_raise(expense_id)
-        del self._expenses[expense_id]
-        self._persist()
-
-    def get(self, expense_id: str) -> Expense:
-        """Return an expense or raise if it does not exist."""
-        return self._get_or_raise(expense_id)
-
-    def list(self, **filters: object) -> List[Expense]:
-        records: Iterable[Expense] = self._expenses.values()
-        records = list(self._apply_filters(records, filters))
-        return sorted(records, key=lambda exp: exp.incurred_at)
+class _LedgerRepository(Repository[M]):
+    """Repository for dated, amount-bearing records grouped by one lowercase key.
+
+    Keeps a chronological view, a per-group index and running cent totals so list and
+    total calls avoid full scans where the filters allow.
+    """
+
+    _date_field: str
+    _date_key: Callable[[M], datetime]
+    _group_key: Callable[[M], str]
+    _group_filter: str
+    # Filter names in the positional order ``_compile_filters`` takes them.
+    _filter_keys: Tuple[str, ...]
+    _compile_filters: Callable[..., _CompiledFilters]
+
+    def __init__(self, storage: JSONStorage, resource: str) -> None:
+        self._ordered: Optional[Tuple[M, ...]] = None
+        # (ordered view, running cent sums over it) for date-range totals; rebuilt when the view is.
+        self._cumulative: Optional[Tuple[Tuple[M, ...], List[int]]] = None
+        # Secondary index keyed by the lowercase group so that filter skips a full scan.
+        self._by_group: Dict[str, Dict[str, M]] = {}
+        # Insertion sequence per record id, breaking date ties in group buckets the same way the
+        # stable sort of ``_records`` does; updates keep their number, as they keep their dict slot.
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = count()
+        # Running totals in cents, kept in step with the index, answer unfiltered and
+        # group-only totals without touching the records.
+        self._total_cents = 0
+        self._cents_by_group: Dict[str, int] = {}
+        # The attachments root is fixed for the service's lifetime; resolve it once, not per record.
+        self._attachments_root = storage.base_path / "attachments"
+        self._attachments_root_resolved = self._attachments_root.resolve()
+        self._validators = self._field_validators()
+        super().__init__(storage, resource)
+
+    def list(self, **filters: object) -> List[M]:
+        # Filtering preserves order, so the cached chronological view needs no re-sort.
+        return list(self._apply_filters(filters))
 
     def total(self, **filters: object) -> Decimal:
-        expenses = self.list(**filters)
-        return sum((expense.amount for expense in expenses), start=Decimal("0.00"))
-
-    def load(self) -> None:
-        """Load existing expenses from persistence."""
-        raw_records = self._storage.load(self._resource)
-        self._expenses = {
-            payload["id"]: Expense.from_dict(payload) for payload in raw_records
-        }
-
-    # Internal helpers -----------------------------------------------------
-    def _persist(self) -> None:
-        try:
-            # Persist current snapshot; storage layer handles atomic writes.
-            self._storage.save(
-                self._resource, [expense.to_dict() for expense in self._expenses.values()]
-            )
-        except PersistenceError:
-            raise
-        except Exception as exc:  # pragma: no cover - defensive guard
-            raise PersistenceError("Unexpected error while saving expenses") from exc
-
-    def _get_or_raise(self, expense_id: str) -> Expense:
+        active = [key for key in self._filter_keys if filters.get(key) is not None]
+        if not active:
+            return cents_to_decimal(self._total_cents)
+        if active == [self._group_filter]:
+            group = sys.intern(str(filters[self._group_filter]).strip().lower())
+            if group:
+                return cents_to_decimal(self._cents_by_group.get(group, 0))
+        if all(key in _DATE_FILTER_KEYS for key in active):
+            # A pure date range is a contiguous slice of the ordered view: two bisects and a subtraction.
+            start = validate_datetime(filters["start"], "start") if "start" in active else None
+            end = validate_datetime(filters["end"], "end") if "end" in active else None
+            ordered, cumulative = self._cumulative_cents()
+            low, high = self._date_bounds(ordered, start, end)
+            return cents_to_decimal(cumulative[high] - cumulative[low] if high > low else 0)
+        records = self.list(**filters)
+        return cents_to_decimal(sum(record.amount_cents for record in records))
+
+    def list_with_total(self, **filters: object) -> Tuple[List[M], Decimal]:
+        """Return the filtered records and their total from a single filtering pass."""
+        records = self.list(**filters)
+        total_cents = 0
+        for record in records:
+            total_cents += record.amount_cents
+        return records, cents_to_decimal(total_cents)
+
+    def _apply_filters(self, filters: Dict[str, object]) -> Iterable[M]:
+        raw = tuple(filters.get(key) for key in self._filter_keys)
         try:
-            return self._expenses[expense_id]
-        except KeyError as exc:
-            raise RecordNotFoundError(f"Expense {expense_id} not found") from exc
+            group, start, end, checks = self._compile_filters(*raw)
+        except TypeError:
+            # An unhashable filter value cannot key the cache; normalise it uncached.
+            group, start, end, checks = self._compile_filters.__wrapped__(*raw)
+        # The group and date range are answered by the indices; only the rest is checked per record.
+        records: Iterable[M] = self._candidates(group, start, end)
+        for check in checks:
+            records = filter(check, records)
+        return records
+
+    @abstractmethod
+    def _field_validators(self) -> Dict[str, Tuple[str, Callable[[object], object]]]:
+        """Map payload keys to (model field, validator), in the order fields are checked."""
 
     def _validate_payload(
-        self, payload: Dict[str, object], *, current: Optional[Expense] = None
+        self, payload: Dict[str, object], *, current: Optional[M] = None
     ) -> Dict[str, object]:
-        root = self._storage.base_path
         # Compose normalised fields ensuring validation across all entry points.
-        base = {
-            "id": current.id if current else str(uuid4()),
-            "amount": parse_amount(payload.get("amount"), "amount"),
-            "currency": validate_currency(str(payload.get("currency", "")).upper()),
-            "category": validate_required_str(payload.get("category"), "category", 50),
-            "payment_method": validate_enum(
-                payload.get("payment_method"), "payment_method", PAYMENT_METHODS
-            ),
-            "incurred_at": validate_datetime(payload.get("incurred_at"), "incurred_at"),
-            "recorded_at": _recorded_datetime(payload.get("recorded_at")),
-            "description": validate_optional_str(payload.get("description"), "description", 200),
-            "merchant": validate_optional_str(payload.get("merchant"), "merchant", 100),
-            "tags": normalize_tags(payload.get("tags")),
-            "receipt_image_path": validate_relative_path(
-                payload.get("receipt_image_path"),
-                Path(root / "attachments"),
-                "receipt_image_path",
-                required_prefix="attachments/receipts",
-            ),
+        data: Dict[str, object] = {"id": current.id if current else str(uuid4())}
+        for key, (name, validate) in self._validators.items():
+            data[name] = validate(payload.get(key))
+        date_field = self._date_field
+        ensure_recorded_after(data[date_field], data["recorded_at"], date_field, "recorded_at")
+        return data
+
+    def _apply_changes(self, existing: M, changes: Dict[str, object]) -> M:
+        # Validate only the fields being changed; the rest of the record is already valid.
+        validated = {
+            name: validate(changes[key])
+            for key, (name, validate) in self._validators.items()
+            if key in changes
         }
-        ensure_recorded_after(
-            base["incurred_at"], base["recorded_at"], "incurred_at", "recorded_at"
-        )
-        return base
-
-    def _apply_filters(self, records: Iterable[Expense], filters: Dict[str, object]) -> Iterable[Expense]:
-        # Pre-compute normalised filter values once to avoid repeated parsing per record.
-        category = (
-            str(filters["category"]).strip().lower()
-            if filters.get("category") is not None
-            else None
-        )
-        payment_method = (
-            str(filters["payment_method"]).strip().lower()
-            if filters.get("payment_method") is not None
-            else None
-        )
-        tag = (
-            str(filters["tag"]).strip().lower()
-            if filters.get("tag") is not None
-            else None
-        )
-        start = (
-            validate_datetime(filters["start"], "start")
-            if filters.get("start") is not None
-            else None
-        )
-        end = (
-            validate_datetime(filters["end"], "end")
-            if filters.get("end") is not None
-            else None
-        )
-        merchant = (
-            str(filters["merchant"]).strip().lower()
-            if filters.get("merchant") is not None
-            else None
-        )
-
-        def matches(expense: Expense) -> bool:
-            if category and expense.category.lower() != category:
-                return False
-            if payment_method and expense.payment_method != payment_method:
-                return False
-            if tag and tag not in expense.tags:
-                return False
-            if start and expense.incurred_at < start:
-                return False
-            if end and expense.incurred_at > end:
-                return False
-            if merchant and (expense.merchant or "").lower() != merchant:
-                return False
-            return True
-
-        return filter(matches, records)
+        updated = replace(existing, **validated)
+        date_field = self._date_field
+        if date_field in validated or "recorded_at" in validated:
+            ensure_recorded_after(
+                self._date_key(updated), updated.recorded_at, date_field, "recorded_at"
+            )
+        return updated
 
-    def rename_category(self, old_name: str, new_name: str) -> None:
-        canonical_old = old_name.strip().lower()
-        canonical_new = new_name.strip()
-        if not canonical_new:
+    def _changed(self) -> None:
+        super()._changed()
+        self._ordered = None
+
+    def _sorted_records(self) -> Tuple[M, ...]:
+        """Return records in date order, re-sorting only after a mutation."""
+        ordered = self._ordered
+        if ordered is None:
+            # Build under the resource lock so a concurrent writer cannot leave a stale view behind.
+            with self._storage.lock(self._resource):
+                ordered = self._ordered
+                if ordered is None:
+                    ordered = tuple(sorted(self._records.values(), key=self._date_key))
+                    self._ordered = ordered
+        return ordered
+
+    def _cumulative_cents(self) -> Tuple[Tuple[M, ...], List[int]]:
+        """Return the ordered view with prefix sums of its cents (index i sums the first i records)."""
+        ordered = self._sorted_records()
+        cached = self._cumulative
+        if cached is None or cached[0] is not ordered:
+            cached = (ordered, list(accumulate((record.amount_cents for record in ordered), initial=0)))
+            self._cumulative = cached
+        return cached
+
+    def _date_bounds(
+        self, records: Sequence[M], start: Optional[datetime], end: Optional[datetime]
+    ) -> Tuple[int, int]:
+        """Return the slice bounds of date-ordered ``records`` falling within [start, end]."""
+        date_key = self._date_key
+        low = bisect_left(records, start, key=date_key) if start else 0
+        high = bisect_right(records, end, key=date_key) if end else len(records)
+        return low, high
+
+    def _reset_index(self) -> None:
+        self._by_group = {}
+        self._sequence = {}
+        self._total_cents = 0
+        self._cents_by_group = {}
+
+    def _index(self, record: M) -> None:
+        key = self._group_key(record)
+        self._by_group.setdefault(key, {})[record.id] = record
+        if record.id not in self._sequence:
+            self._sequence[record.id] = next(self._next_sequence)
+        self._total_cents += record.amount_cents
+        self._cents_by_group[key] = self._cents_by_group.get(key, 0) + record.amount_cents
+
+    def _unindex(self, record: M) -> None:
+        if record.id not in self._records:
+            # Deleted rather than replaced; an update re-indexes the record under its old number.
+            self._sequence.pop(record.id, None)
+        key = self._group_key(record)
+        bucket = self._by_group.get(key)
+        if bucket is None or bucket.pop(record.id, None) is None:
             return
+        self._total_cents -= record.amount_cents
+        if bucket:
+            self._cents_by_group[key] -= record.amount_cents
+        else:
+            del self._by_group[key]
+            del self._cents_by_group[key]
+
+    def _candidates(
+        self, group: Optional[str], start: Optional[datetime], end: Optional[datetime]
+    ) -> Sequence[M]:
+        """Return the date-ordered records narrowed by the indexed group and date range."""
+        if group:
+            with self._storage.lock(self._resource):
+                bucket = self._by_group.get(group)
+                if not bucket:
+                    return ()
+                date_key = self._date_key
+                sequence = self._sequence
+                records: Sequence[M] = sorted(
+                    bucket.values(), key=lambda record: (date_key(record), sequence[record.id])
+                )
+        else:
+            records = self._sorted_records()
+        if start or end:
+            # Records are in date order, so the range is a contiguous slice found by bisection.
+            low, high = self._date_bounds(records, start, end)
+            records = records[low:high]
+        return records
+
+
+class ExpenseService(_LedgerRepository[Expense]):
+    """Manages expense records and mediates persistence."""
 
-        changed = False
-        for expense_id, expense in list(self._expenses.items()):
-            if expense.category.lower() == canonical_old:
-                payload = expense.to_dict()
-                payload["category"] = canonical_new
-                data = self._validate_payload(payload, current=expense)
-                self._expenses[expense_id] = Expense(**data)
-                changed = True
-
-        if changed:
-            self._persist()
-
-    def is_category_in_use(self, category_name: str) -> bool:
-        canonical = category_name.strip().lower()
-        return any(expense.category.lower() == canonical for expense in self._expenses.values())
-
-
-class IncomeService:
-    """Manages income records and mediates persistence."""
-
-    def __init__(self, storage: JSONStorage, resource: str = "incomes.json") -> None:
-        self._storage = storage
-        self._resource = resource
-        self._incomes: Dict[str, Income] = {}
-        self.load()  # Hydrate in-memory cache from persistence on construction.
-
-    def add(self, payload: Dict[str, object]) -> Income:
-        data = self._validate_payload(payload)
-        income = Income(**data)
-        self._incomes[income.id] = income
-        self._persist()
-        return income
+    _model = Expense
+    _label = "Expense"
+    _plural = "expenses"
+    _date_field = "incurred_at"
+    _date_key = staticmethod(attrgetter("incurred_at"))
+    _group_key = staticmethod(attrgetter("_category_lc"))
+    _group_filter = "category"
+    _filter_keys = ("category", "payment_method", "tag", "start", "end", "merchant")
+    _compile_filters = staticmethod(_compile_expense_filters)
 
-    def update(self, income_id: str, changes: Dict[str, object]) -> Income:
-        existing = self._get_or_raise(income_id)
-        # Merge existing serialised data with incoming changes to support partial updates.
-        merged_payload = {**existing.to_dict(), **changes}
-        data = self._validate_payload(merged_payload, current=existing)
-        updated = Income(**data)
-        self._incomes[income_id] = updated
-        self._persist()
-        return updated
+    def __init__(self, storage: JSONStorage, resource: str = "expenses.json") -> None:
+        super().__init__(storage, resource)
 
-    def delete(self, income_id: str) -> None:
-        self._get_or_raise(income_id)
-        del self._incomes[income_id]
-        self._persist()
+    def rename_category(self, old_name: str, new_name: str) -> None:
+        canonical_old = sys.intern(old_name.strip().lower())
+        if not new_name.strip():
+            return
+        # Only the category changes, so validate it once instead of re-validating every record.
+        canonical_new = sys.intern(validate_required_str(new_name, "category", 50))
+
+        with self._storage.lock(self._resource):
+            affected = list(self._by_group.get(canonical_old, {}).values())
+            for expense in affected:
+                # replace() re-runs __post_init__, which recomputes the cached lowercase key.
+                renamed = replace(expense, category=canonical_new)
+                self._records[expense.id] = renamed
+                self._unindex(expense)
+                self._index(renamed)
+
+            if affected:
+                self._changed()
+                self._persist()
 
-    def get(self, income_id: str) -> Income:
-        """Return an income or raise if it does not exist."""
-        return self._get_or_raise(income_id)
+    def is_category_in_use(self, category_name: str) -> bool:
+        canonical = sys.intern(category_name.strip().lower())
+        return bool(self._by_group.get(canonical))
 
-    def list(self, **filters: object) -> List[Income]:
-        records: Iterable[Income] = self._incomes.values()
-        records = list(self._apply_filters(records, filters))
-        return sorted(records, key=lambda inc: inc.received_at)
+    def _field_validators(self) -> Dict[str, Tuple[str, Callable[[object], object]]]:
+        return {
+            "amount": ("amount_cents", lambda value: parse_amount_cents(value, "amount")),
+            "currency": ("currency", lambda value: validate_currency(str(value or "").upper())),
+            "category": (
+                "category",
+                lambda value: sys.intern(validate_required_str(value, "category", 50)),
+            ),
+            "payment_method": (
+                "payment_method",
+                lambda value: validate_enum(value, "payment_method", PAYMENT_METHODS),
+            ),
+            "incurred_at": ("incurred_at", lambda value: validate_datetime(value, "incurred_at")),
+            "recorded_at": ("recorded_at", _recorded_datetime),
+            "description": (
+                "description",
+                lambda value: validate_optional_str(value, "description", 200),
+            ),
+            "merchant": ("merchant", lambda value: validate_optional_str(value, "merchant", 100)),
+            "tags": ("tags", lambda value: tuple(normalize_tags(value))),
+            "receipt_image_path": (
+                "receipt_image_path",
+                lambda value: validate_relative_path(
+                    value,
+                    self._attachments_root,
+                    "receipt_image_path",
+                    required_prefix="attachments/receipts",
+                    resolved_root=self._attachments_root_resolved,
+                ),
+            ),
+        }
 
-    def total(self, **filters: object) -> Decimal:
-        incomes = self.list(**filters)
-        return sum((income.amount for income in incomes), start=Decimal("0.00"))
 
-    def load(self) -> None:
-        raw_records = self._storage.load(self._resource)
-        self._incomes = {
-            payload["id"]: Income.from_dict(payload) for payload in raw_records
-        }
+class IncomeService(_LedgerRepository[Income]):
+    """Manages income records and mediates persistence."""
 
-    def _persist(self) -> None:
-        try:
-            # Persist current snapshot; storage layer handles atomic writes.
-            self._storage.save(
-                self._resource, [income.to_dict() for income in self._incomes.values()]
-            )
-        except PersistenceError:
-            raise
-        except Exception as exc:  # pragma: no cover - defensive guard
-            raise PersistenceError("Unexpected error while saving incomes") from exc
+    _model = Income
+    _label = "Income"
+    _plural = "incomes"
+    _date_field = "received_at"
+    _date_key = staticmethod(attrgetter("received_at"))
+    _group_key = staticmethod(attrgetter("_source_lc"))
+    _group_filter = "source"
+    _filter_keys = ("source", "received_method", "tag", "start", "end")
+    _compile_filters = staticmethod(_compile_income_filters)
 
-    def _get_or_raise(self, income_id: str) -> Income:
-        try:
-            return self._incomes[income_id]
-        except KeyError as exc:
-            raise RecordNotFoundError(f"Income {income_id} not found") from exc
+    def __init__(self, storage: JSONStorage, resource: str = "incomes.json") -> None:
+        super().__init__(storage, resource)
 
-    def _validate_payload(
-        self, payload: Dict[str, object], *, current: Optional[Income] = None
-    ) -> Dict[str, object]:
-        root = self._storage.base_path
-        # Compose normalised fields ensuring validation across all entry points.
-        base = {
-            "id": current.id if current else str(uuid4()),
-            "amount": parse_amount(payload.get("amount"), "amount"),
-            "currency": validate_currency(str(payload.get("currency", "")).upper()),
-            "source": validate_required_str(payload.get("source"), "source", 50),
-            "received_method": validate_enum(
-                payload.get("received_method"), "received_method", INCOME_METHODS
+    def _field_validators(self) -> Dict[str, Tuple[str, Callable[[object], object]]]:
+        return {
+            "amount": ("amount_cents", lambda value: parse_amount_cents(value, "amount")),
+            "currency": ("currency", lambda value: validate_currency(str(value or "").upper())),
+            "source": (
+                "source",
+                lambda value: sys.intern(validate_required_str(value, "source", 50)),
             ),
-            "received_at": validate_datetime(payload.get("received_at"), "received_at"),
-            "recorded_at": _recorded_datetime(payload.get("recorded_at")),
-            "description": validate_optional_str(payload.get("description"), "description", 200),
-            "tags": normalize_tags(payload.get("tags")),
-            "attachment_path": validate_relative_path(
-                payload.get("attachment_path"),
-                Path(root / "attachments"),
+            "received_method": (
+                "received_method",
+                lambda value: validate_enum(value, "received_method", INCOME_METHODS),
+            ),
+            "received_at": ("received_at", lambda value: validate_datetime(value, "received_at")),
+            "recorded_at": ("recorded_at", _recorded_datetime),
+            "description": (
+                "description",
+                lambda value: validate_optional_str(value, "description", 200),
+            ),
+            "tags": ("tags", lambda value: tuple(normalize_tags(value))),
+            "attachment_path": (
                 "attachment_path",
-                required_prefix="attachments/income_docs",
+                lambda value: validate_relative_path(
+                    value,
+                    self._attachments_root,
+                    "attachment_path",
+                    required_prefix="attachments/income_docs",
+                    resolved_root=self._attachments_root_resolved,
+                ),
             ),
         }
-        ensure_recorded_after(
-            base["received_at"], base["recorded_at"], "received_at", "recorded_at"
-        )
-        return base
-
-    def _apply_filters(self, records: Iterable[Income], filters: Dict[str, object]) -> Iterable[Income]:
-        # Pre-compute normalised filter values once to avoid repeated parsing per record.
-        source = (
-            str(filters["source"]).strip().lower()
-            if filters.get("source") is not None
-            else None
-        )
-        received_method = (
-            str(filters["received_method"]).strip().lower()
-            if filters.get("received_method") is not None
-            else None
-        )
-        tag = (
-            str(filters["tag"]).strip().lower()
-            if filters.get("tag") is not None
-            else None
-        )
-        start = (
-            validate_datetime(filters["start"], "start")
-            if filters.get("start") is not None
-            else None
-        )
-        end = (
-            validate_datetime(filters["end"], "end")
-            if filters.get("end") is not None
-            else None
-        )
-
-        def matches(income: Income) -> bool:
-            if source and income.source.lower() != source:
-                return False
-            if received_method and income.received_method != received_method:
-                return False
-            if tag and tag not in income.tags:
-                return False
-            if start and income.received_at < start:
-                return False
-            if end and income.received_at > end:
-                return False
-            return True
-
-        return filter(matches, records)
 
 
 class LedgerService:
@@ -428,6 +612,12 @@ class LedgerService:
         expense_total = self._expenses.total(**filters)
         return income_total - expense_total
 
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """Group many changes so each storage file is written once when the block exits."""
+        with self._expenses.storage.batch(), self._incomes.storage.batch():
+            yield
+
     def refresh(self) -> None:
         """Reload data from persistence for both services."""
         self._expenses.load()
@@ -2,28 +2,154 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
 
 from .exceptions import PersistenceError
 
+# The change log is folded into a fresh snapshot once it holds this many entries per record.
+_LOG_COMPACTION_RATIO = 4
+_LOG_COMPACTION_MIN_ENTRIES = 64
+# O_BINARY only exists on Windows, where leaving it out would translate newlines in the payload.
+_TEMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+class _BatchState(threading.local):
+    """Per-thread batch bookkeeping, so one thread's batch never defers another thread's writes."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.pending: Dict[str, Iterable[Dict[str, Any]]] = {}
+        self.pending_entries: Dict[str, List[bytes]] = {}
+
+
+def _encode_default(obj: Any) -> Any:
+    # Records arrive as JSON natives from to_dict; this only catches raw amounts saved directly.
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serialisable")
+
 
 class JSONStorage:
-    """Simple file-based JSON storage with crash-safe writes."""
+    """Simple file-based JSON storage with crash-safe writes.
+
+    Each resource is a JSON array snapshot plus an optional ``<resource>.log`` of
+    newline-delimited change entries. Single-record changes are appended to the log,
+    ``load`` folds the log over the snapshot and ``save`` replaces both with a new snapshot.
+    A log opens with a header naming the digest of the snapshot it extends, so a log left
+    behind by a crash after its snapshot was replaced is discarded instead of replayed.
+    Snapshots are written compactly unless ``indent`` is set for human-readable debugging.
+    """
 
-    def __init__(self, base_path: Path) -> None:
+    def __init__(self, base_path: Path, *, indent: bool = False) -> None:
         self._base_path = base_path
         self._base_path.mkdir(parents=True, exist_ok=True)
+        self._dumps_options = orjson.OPT_INDENT_2 if indent else 0
+        self._locks: Dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+        self._batch = _BatchState()
+        self._snapshot_sizes: Dict[str, int] = {}
+        self._log_sizes: Dict[str, int] = {}
+        # Hex digest of each snapshot file as last read or written; None when there is no file.
+        self._snapshot_digests: Dict[str, Optional[str]] = {}
+        # (content digest, mtime_ns, size) of the snapshot file as this instance last wrote it.
+        self._written: Dict[str, Tuple[bytes, int, int]] = {}
+
+    def lock(self, resource: str) -> threading.RLock:
+        """Return the re-entrant lock serialising access to ``resource``."""
+        with self._locks_guard:
+            lock = self._locks.get(resource)
+            if lock is None:
+                lock = self._locks[resource] = threading.RLock()
+            return lock
 
     def load(self, resource: str) -> List[Dict[str, Any]]:
+        with self.lock(resource):
+            records = self._read_snapshot(resource)
+            self._snapshot_sizes[resource] = len(records)
+            log_path = self._log_path(resource)
+            if not log_path.exists():
+                self._log_sizes[resource] = 0
+                return records
+            by_id = {record["id"]: record for record in records}
+            self._log_sizes[resource] = self._replay_log(resource, log_path, by_id)
+            return list(by_id.values())
+
+    def save(self, resource: str, records: Iterable[Dict[str, Any]]) -> None:
+        batch = self._batch
+        if batch.depth:
+            # Only the latest snapshot matters; it is materialised when the batch flushes.
+            batch.pending[resource] = records
+            batch.pending_entries.pop(resource, None)
+            return
+        self._write(resource, records)
+
+    def append(self, resource: str, record: Dict[str, Any]) -> None:
+        """Log an insert or update of ``record`` without rewriting the snapshot."""
+        self._log_entry(resource, orjson.dumps({"put": record}, default=_encode_default))
+
+    def tombstone(self, resource: str, record_id: str) -> None:
+        """Log the deletion of ``record_id`` without rewriting the snapshot."""
+        self._log_entry(resource, orjson.dumps({"delete": record_id}))
+
+    def compact(self, resource: str) -> None:
+        """Fold the change log into a fresh snapshot and drop the log."""
+        with self.lock(resource):
+            self._write(resource, self.load(resource))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saves made inside the block and write each dirty resource once on exit.
+
+        Batches nest; the outermost block flushes, even when it exits with an exception,
+        so the files keep matching the in-memory state the services already hold. Only the
+        calling thread's saves are deferred; other threads keep writing straight through.
+        """
+        batch = self._batch
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if not batch.depth:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write every resource saved or changed during this thread's batch."""
+        batch = self._batch
+        while batch.pending:
+            resource, records = batch.pending.popitem()
+            self._write(resource, records)
+        while batch.pending_entries:
+            resource, entries = batch.pending_entries.popitem()
+            self._append_entries(resource, entries)
+
+    def _log_path(self, resource: str) -> Path:
+        path = self._base_path / resource
+        return path.with_suffix(path.suffix + ".log")
+
+    def _read_snapshot(self, resource: str) -> List[Dict[str, Any]]:
         path = self._base_path / resource
         if not path.exists():
+            self._snapshot_digests[resource] = None
             return []
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except json.JSONDecodeError as exc:
+            # Decode straight from the page cache through a memory map instead of copying the
+            # whole file into a bytes object first. An empty file cannot be mapped: it is corrupt.
+            with path.open("rb") as handle, mmap.mmap(
+                handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped, memoryview(mapped) as view:
+                payload = orjson.loads(view)
+                self._snapshot_digests[resource] = hashlib.blake2b(view, digest_size=16).hexdigest()
+        except (orjson.JSONDecodeError, ValueError) as exc:
             raise PersistenceError(f"Corrupted JSON data in {path}") from exc
         except OSError as exc:
             raise PersistenceError(f"Unable to read from {path}") from exc
@@ -32,17 +158,147 @@ class JSONStorage:
             raise PersistenceError(f"Expected list payload in {path}")
         return payload
 
-    def save(self, resource: str, records: Iterable[Dict[str, Any]]) -> None:
+    def _replay_log(self, resource: str, log_path: Path, by_id: Dict[str, Dict[str, Any]]) -> int:
+        try:
+            data = log_path.read_bytes()
+            complete = data.rfind(b"\n") + 1
+            if complete != len(data):
+                # A torn final entry means the process died mid-append; that change never landed.
+                # Cut it off so the next append starts on a fresh line instead of extending it.
+                os.truncate(log_path, complete)
+        except OSError as exc:
+            raise PersistenceError(f"Unable to read from {log_path}") from exc
+        lines = data[:complete].splitlines()
+        corrupted = f"Corrupted log entry in {log_path}"
+        for index, line in enumerate(lines):
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                raise PersistenceError(corrupted) from exc
+            if not isinstance(entry, dict):
+                raise PersistenceError(corrupted)
+            if "base" in entry:
+                if index:
+                    raise PersistenceError(corrupted)
+                if entry["base"] != self._snapshot_digests.get(resource):
+                    # The snapshot was replaced after this log was started (a crash between writing
+                    # it and removing the log), so it already holds everything worth keeping.
+                    try:
+                        log_path.unlink(missing_ok=True)
+                    except OSError as exc:
+                        raise PersistenceError(f"Unable to remove {log_path}") from exc
+                    return 0
+            elif "put" in entry:
+                record = entry["put"]
+                if not isinstance(record, dict) or not isinstance(record.get("id"), str):
+                    raise PersistenceError(corrupted)
+                by_id[record["id"]] = record
+            elif isinstance(entry.get("delete"), str):
+                by_id.pop(entry["delete"], None)
+            else:
+                raise PersistenceError(corrupted)
+        return len(lines)
+
+    def _log_entry(self, resource: str, entry: bytes) -> None:
+        batch = self._batch
+        if batch.depth:
+            if resource in batch.pending:
+                # The pending snapshot is built from live state at flush, so it already covers this change.
+                return
+            batch.pending_entries.setdefault(resource, []).append(entry)
+            return
+        self._append_entries(resource, [entry])
+
+    def _append_entries(self, resource: str, entries: List[bytes]) -> None:
+        log_path = self._log_path(resource)
+        with self.lock(resource):
+            if resource not in self._log_sizes:
+                # Loading first trims a torn tail and drops a stale log before anything is added.
+                self.load(resource)
+            try:
+                with log_path.open("ab") as handle:
+                    created = not handle.tell()
+                    if created:
+                        entries = [self._log_header(resource), *entries]
+                    handle.write(b"\n".join(entries) + b"\n")
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            except OSError as exc:
+                raise PersistenceError(f"Unable to write to {log_path}") from exc
+            if created:
+                self._sync_directory()
+            log_size = self._log_sizes.get(resource, 0) + len(entries)
+            self._log_sizes[resource] = log_size
+            limit = max(
+                _LOG_COMPACTION_MIN_ENTRIES,
+                _LOG_COMPACTION_RATIO * self._snapshot_sizes.get(resource, 0),
+            )
+            if log_size > limit:
+                self.compact(resource)
+
+    def _log_header(self, resource: str) -> bytes:
+        return orjson.dumps({"base": self._snapshot_digests.get(resource)})
+
+    def _write(self, resource: str, records: Iterable[Dict[str, Any]]) -> None:
         path = self._base_path / resource
         temp_path = path.with_suffix(path.suffix + ".tmp")
+        # Request threads share the temp file name, so writes to one resource must not interleave.
+        with self.lock(resource):
+            snapshot = list(records)
+            payload = orjson.dumps(snapshot, default=_encode_default, option=self._dumps_options)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            log_path = self._log_path(resource)
+            if self._is_current(resource, path, log_path, digest):
+                return
+            try:
+                fd = os.open(temp_path, _TEMP_OPEN_FLAGS, 0o666)
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    # The data must be on disk before the rename can expose it under the real name.
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as exc:
+                raise PersistenceError(f"Unable to write to {temp_path}") from exc
+            # Use replace for atomic move on POSIX; ensures crash-safe persistence.
+            temp_path.replace(path)
+            # Make the rename durable before the log it supersedes is removed.
+            self._sync_directory()
+            self._snapshot_digests[resource] = digest.hex()
+            # A log left behind if this unlink never happens names the old digest and is discarded.
+            log_path.unlink(missing_ok=True)
+            self._snapshot_sizes[resource] = len(snapshot)
+            self._log_sizes[resource] = 0
+            stat = path.stat()
+            self._written[resource] = (digest, stat.st_mtime_ns, stat.st_size)
+
+    def _sync_directory(self) -> None:
+        # Renames and new files only survive a crash once their directory is synced. Windows
+        # cannot open a directory for syncing, so the step is skipped there.
+        if not hasattr(os, "O_DIRECTORY"):
+            return
         try:
-            with temp_path.open("w", encoding="utf-8") as handle:
-                json.dump(list(records), handle, indent=2)
-                handle.flush()
+            fd = os.open(self._base_path, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
         except OSError as exc:
-            raise PersistenceError(f"Unable to write to {temp_path}") from exc
-        # Use replace for atomic move on POSIX; ensures crash-safe persistence.
-        temp_path.replace(path)
+            raise PersistenceError(f"Unable to sync {self._base_path}") from exc
+
+    def _is_current(self, resource: str, path: Path, log_path: Path, digest: bytes) -> bool:
+        """Return True when the file on disk already holds exactly this snapshot and no log."""
+        written = self._written.get(resource)
+        if written is None or written[0] != digest or log_path.exists():
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        # Another process may have rewritten the file since; only trust it if it is untouched.
+        return (stat.st_mtime_ns, stat.st_size) == written[1:]
 
     @property
     def base_path(self) -> Path:
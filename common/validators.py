@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+import string
+import sys
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from pathlib import Path
@@ -11,38 +13,56 @@ from typing import Iterable, List, Optional
 from .exceptions import ValidationError
 from .models import parse_datetime
 
+_TWO_PLACES = Decimal("0.01")
+
 CURRENCY_PATTERN = re.compile(r"^[A-Z]{3}$")
 TAG_PATTERN = re.compile(r"^[a-z0-9_-]{1,30}$")
+# Translation table deleting every character TAG_PATTERN allows; anything left over is invalid.
+_TAG_REJECT = str.maketrans("", "", string.ascii_lowercase + string.digits + "_-")
 
-PAYMENT_METHODS = {
+PAYMENT_METHODS = frozenset({
     "cash",
     "debit_card",
     "credit_card",
     "bank_transfer",
     "mobile_payment",
     "other",
-}
+})
 
-INCOME_METHODS = {
+INCOME_METHODS = frozenset({
     "salary",
     "bonus",
     "interest",
     "gift",
     "other",
+})
+
+# Error text for the fixed method sets, built once rather than sorted on every rejection.
+_ENUM_CHOICES = {
+    PAYMENT_METHODS: ", ".join(sorted(PAYMENT_METHODS)),
+    INCOME_METHODS: ", ".join(sorted(INCOME_METHODS)),
 }
 
 
 def _quantize_two_decimals(amount: Decimal) -> Decimal:
     """Round the amount to two decimal places using bankers-safe HALF_UP rounding."""
-    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return amount.quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
 
 def parse_amount(raw: object, field: str) -> Decimal:
     """Convert raw input to a positive Decimal with exactly two fraction digits."""
-    try:
-        amount = Decimal(str(raw))
-    except (InvalidOperation, TypeError) as exc:  # type: ignore[arg-type]
-        raise ValidationError(f"{field} must be a numeric value") from exc
+    # Decimal and int input convert exactly, so skip the round trip through str().
+    # bool is excluded on purpose: str(True) is not numeric and must keep failing.
+    raw_type = type(raw)
+    if raw_type is Decimal:
+        amount = raw
+    elif raw_type is int:
+        amount = Decimal(raw)
+    else:
+        try:
+            amount = Decimal(str(raw))
+        except (InvalidOperation, TypeError) as exc:  # type: ignore[arg-type]
+            raise ValidationError(f"{field} must be a numeric value") from exc
 
     if amount <= 0:
         raise ValidationError(f"{field} must be greater than zero")
@@ -50,10 +70,22 @@ def parse_amount(raw: object, field: str) -> Decimal:
     return _quantize_two_decimals(amount)
 
 
+def parse_amount_cents(raw: object, field: str) -> int:
+    """Validate raw input like parse_amount and return it as integer cents."""
+    return int(parse_amount(raw, field).scaleb(2))
+
+
 def validate_currency(code: str) -> str:
-    if not isinstance(code, str) or not CURRENCY_PATTERN.fullmatch(code):
+    # Same rule as CURRENCY_PATTERN, checked with C-level str predicates instead of the regex engine.
+    if not (
+        isinstance(code, str)
+        and len(code) == 3
+        and code.isascii()
+        and code.isalpha()
+        and code.isupper()
+    ):
         raise ValidationError("currency must be a 3-letter ISO 4217 code (uppercase)")
-    return code
+    return sys.intern(code)
 
 
 def validate_required_str(value: object, field: str, max_length: int) -> str:
@@ -86,7 +118,7 @@ def normalize_tags(raw_tags: Optional[Iterable[object]]) -> List[str]:
             raise ValidationError("tags cannot be empty strings")
         if len(tag) > 30:
             raise ValidationError("tags must be at most 30 characters")
-        if not TAG_PATTERN.fullmatch(tag):
+        if tag.translate(_TAG_REJECT):
             raise ValidationError("tags may only contain lowercase letters, digits, underscores, or hyphens")
         if tag in seen:
             continue
@@ -110,8 +142,11 @@ def validate_enum(value: object, field: str, allowed: Iterable[str]) -> str:
         raise ValidationError(f"{field} must be a string")
     canonical = value.strip().lower()
     if canonical not in allowed:
-        raise ValidationError(f"{field} must be one of: {', '.join(sorted(allowed))}")
-    return canonical
+        choices = _ENUM_CHOICES.get(allowed) if isinstance(allowed, frozenset) else None
+        if choices is None:
+            choices = ", ".join(sorted(allowed))
+        raise ValidationError(f"{field} must be one of: {choices}")
+    return sys.intern(canonical)
 
 
 def validate_relative_path(
@@ -120,7 +155,13 @@ def validate_relative_path(
     field: str,
     *,
     required_prefix: Optional[str] = None,
+    resolved_root: Optional[Path] = None,
 ) -> Optional[str]:
+    """Validate a path relative to ``root`` that must not escape it.
+
+    Callers validating many paths against one root can pass ``resolved_root`` (the result of
+    ``root.resolve()``) to skip resolving it on every call.
+    """
     if raw is None:
         return None
     if not isinstance(raw, str):
@@ -137,12 +178,24 @@ def validate_relative_path(
             raise ValidationError(
                 f"{field} must start with '{required_prefix}' to stay within the attachments area"
             )
+    base_root = resolved_root if resolved_root is not None else root.resolve()
+    target = root / candidate
+    if ".." not in candidate.parts:
+        # Without parent references the path is lexically under root, so only a symlink could lead
+        # out of it: reject a linked leaf and check the real location of its folder. The folder
+        # is resolved on every call because links may be created or swapped at any time.
+        try:
+            leaf_is_link = target.is_symlink()
+            folder = target.parent.resolve()
+        except OSError as exc:
+            raise ValidationError(f"{field} points to an invalid path") from exc
+        if not leaf_is_link and (folder == base_root or base_root in folder.parents):
+            return str(candidate.as_posix())
     try:
-        resolved = (root / candidate).resolve()
+        resolved = target.resolve()
     except OSError as exc:
         raise ValidationError(f"{field} points to an invalid path") from exc
     # Ensure the final path stays under the configured storage root to avoid traversal.
-    base_root = root.resolve()
     if resolved == base_root:
         return str(candidate.as_posix())
     if base_root not in resolved.parents:
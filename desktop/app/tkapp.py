@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import argparse
+import re
 import tkinter as tk
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from tkinter import messagebox, simpledialog, ttk
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from common.exceptions import PersistenceError, RecordNotFoundError, ValidationError
-from common.models import Category, parse_datetime
+from common.models import Category, Expense, Income, isoformat_utc, parse_datetime
 from common.services import CategoryService, ExpenseService, IncomeService, LedgerService
 from common.storage import JSONStorage
 from common.validators import INCOME_METHODS, PAYMENT_METHODS
@@ -23,25 +26,171 @@ ACCENT_BG = "#1d4ed8"
 ACCENT_ACTIVE_BG = "#2563eb"
 TEXT_PRIMARY = "#e2e8f0"
 TEXT_MUTED = "#94a3b8"
+# Tcl global set once an interpreter has been themed by _configure_styles.
+_STYLED_FLAG = "expense_tracker_styled"
+
+# ttk style options applied by ExpenseTrackerApp, in the order they are configured.
+THEME: Dict[str, Dict[str, Any]] = {
+    "TFrame": {"background": PRIMARY_BG},
+    "TLabel": {"background": PRIMARY_BG, "foreground": TEXT_PRIMARY},
+    "Panel.TFrame": {"background": SECONDARY_BG, "relief": "flat"},
+    "Card.TLabelframe": {"background": SECONDARY_BG, "foreground": TEXT_PRIMARY},
+    "Card.TLabelframe.Label": {"background": SECONDARY_BG, "foreground": TEXT_PRIMARY},
+    "Header.TFrame": {"background": PRIMARY_BG},
+    "Summary.TFrame": {"background": SECONDARY_BG},
+    "Metric.TFrame": {"background": SECONDARY_BG},
+    "FormLabel.TLabel": {"background": SECONDARY_BG, "foreground": TEXT_MUTED, "font": ("Segoe UI", 9)},
+    "Header.TLabel": {"background": PRIMARY_BG, "foreground": TEXT_PRIMARY, "font": ("Segoe UI", 20, "bold")},
+    "MetricLabel.TLabel": {"background": SECONDARY_BG, "foreground": TEXT_MUTED, "font": ("Segoe UI", 9, "bold")},
+    "MetricValue.TLabel": {"background": SECONDARY_BG, "foreground": TEXT_PRIMARY, "font": ("Segoe UI", 16, "bold")},
+    "MetricNegative.TFrame": {
+        "background": "#321524",
+        "bordercolor": "#f87171",
+        "relief": "solid",
+        "borderwidth": 1,
+    },
+    "MetricValueNegative.TLabel": {
+        "background": "#321524",
+        "foreground": "#fca5a5",
+        "font": ("Segoe UI", 16, "bold"),
+    },
+    "App.TEntry": {
+        "fieldbackground": SECONDARY_BG,
+        "background": SECONDARY_BG,
+        "foreground": TEXT_PRIMARY,
+        "insertcolor": TEXT_PRIMARY,
+        "bordercolor": ACCENT_BG,
+    },
+    "App.TCombobox": {
+        "fieldbackground": SECONDARY_BG,
+        "background": SECONDARY_BG,
+        "foreground": TEXT_PRIMARY,
+        "arrowcolor": TEXT_PRIMARY,
+    },
+    "Primary.TButton": {
+        "background": ACCENT_BG,
+        "foreground": TEXT_PRIMARY,
+        "bordercolor": ACCENT_BG,
+        "focustcolor": TEXT_PRIMARY,
+        "padding": (18, 6),
+    },
+    "Secondary.TButton": {
+        "background": SECONDARY_BG,
+        "foreground": TEXT_PRIMARY,
+        "bordercolor": SECONDARY_BG,
+        "padding": (14, 6),
+    },
+    "App.Treeview": {
+        "background": SECONDARY_BG,
+        "fieldbackground": SECONDARY_BG,
+        "foreground": TEXT_PRIMARY,
+        "bordercolor": SECONDARY_BG,
+        "rowheight": 28,
+    },
+    "App.Treeview.Heading": {"background": SECONDARY_BG, "foreground": TEXT_MUTED, "relief": "flat"},
+    "App.TNotebook": {"background": PRIMARY_BG, "borderwidth": 0},
+    "App.TNotebook.Tab": {"background": SECONDARY_BG, "foreground": TEXT_MUTED, "padding": (16, 10)},
+}
+
+# State-dependent style options, applied after THEME.
+THEME_MAPS: Dict[str, Dict[str, List[Tuple[str, str]]]] = {
+    "App.TEntry": {
+        "fieldbackground": [("focus", SECONDARY_BG)],
+        "foreground": [("disabled", TEXT_MUTED)],
+    },
+    "App.TCombobox": {
+        "fieldbackground": [("readonly", SECONDARY_BG)],
+        "foreground": [("disabled", TEXT_MUTED)],
+    },
+    "Primary.TButton": {
+        "background": [("active", ACCENT_ACTIVE_BG)],
+        "foreground": [("disabled", TEXT_MUTED)],
+    },
+    "Secondary.TButton": {
+        "background": [("active", ACCENT_BG)],
+        "foreground": [("disabled", TEXT_MUTED)],
+    },
+    "App.Treeview": {
+        "background": [("selected", ACCENT_BG)],
+        "foreground": [("selected", TEXT_PRIMARY)],
+    },
+    "App.TNotebook.Tab": {
+        "background": [("selected", ACCENT_BG)],
+        "foreground": [("selected", TEXT_PRIMARY)],
+    },
+}
+
+
+def _tcl_word(value: Any) -> str:
+    """Quote a theme option value as one Tcl word; tuples become Tcl lists."""
+    if isinstance(value, tuple):
+        text = " ".join(_tcl_word(item) for item in value)
+    else:
+        text = str(value)
+    if not text or any(char.isspace() for char in text):
+        return "{" + text + "}"
+    return text
+
+
+def _theme_script() -> str:
+    commands = [
+        " ".join(
+            ["ttk::style", "configure", name]
+            + [f"-{option} {_tcl_word(value)}" for option, value in options.items()]
+        )
+        for name, options in THEME.items()
+    ]
+    commands.extend(
+        " ".join(
+            ["ttk::style", "map", name]
+            + [
+                f"-{option} {_tcl_word(tuple(item for pair in specs for item in pair))}"
+                for option, specs in options.items()
+            ]
+        )
+        for name, options in THEME_MAPS.items()
+    )
+    commands.append(f"set {_STYLED_FLAG} 1")
+    return "\n".join(commands)
+
+
+# THEME and THEME_MAPS rendered as one Tcl script, built once at import.
+_THEME_SCRIPT = _theme_script()
+
+_PAYMENT_METHODS_SORTED = tuple(sorted(PAYMENT_METHODS))
+_INCOME_METHODS_SORTED = tuple(sorted(INCOME_METHODS))
+_STRIP_COMMAS = str.maketrans("", "", ",")
+# Splitting on the separator together with its surrounding whitespace strips every tag in one pass.
+_TAG_SEPARATOR = re.compile(r"\s*,\s*")
+
+# Tcl lambda that clears a Treeview and inserts a flat (iid, values, iid, values, ...) list,
+# so a whole refresh is a single interpreter crossing instead of one per row.
+_REPLACE_ROWS = (
+    "{tree rows} {"
+    "$tree delete [$tree children {}]; "
+    "foreach {iid values} $rows {$tree insert {} end -id $iid -values $values}"
+    "}"
+)
 
 
 def _iso_now() -> str:
-    now = datetime.now(timezone.utc)
-    return now.isoformat(timespec="seconds").replace("+00:00", "Z")
+    return isoformat_utc(datetime.now(timezone.utc))
 
 
-def _current_date_time() -> Tuple[str, str]:
-    now = datetime.now(timezone.utc)
-    return now.strftime("%Y-%m-%d"), now.strftime("%H:%M")
+def _date_time_parts(dt: datetime) -> Tuple[str, str]:
+    # Attribute formatting is roughly three times cheaper than two strftime calls.
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}",
+        f"{dt.hour:02d}:{dt.minute:02d}",
+    )
 
 
-def split_iso_datetime(value: str) -> Tuple[str, str]:
-    dt = parse_user_datetime(value)
-    dt = dt.astimezone(timezone.utc)
-    return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M")
+def _current_date_time() -> Tuple[str, str]:
+    return _date_time_parts(datetime.now(timezone.utc))
 
 
-def combine_date_time(date_str: str, time_str: Optional[str]) -> str:
+def combine_date_time_dt(date_str: str, time_str: Optional[str]) -> datetime:
+    """Combine the form's date and optional time fields into a UTC datetime."""
     date_text = (date_str or "").strip()
     if not date_text:
         raise ValueError("Date is required")
@@ -51,19 +200,40 @@ def combine_date_time(date_str: str, time_str: Optional[str]) -> str:
         dt = datetime.fromisoformat(candidate)
     except ValueError as exc:
         raise ValueError("Invalid date or time") from exc
-    return dt.replace(tzinfo=timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    return dt.replace(tzinfo=timezone.utc)
 
 
 def sanitize_amount_input(raw: str) -> str:
     if raw is None:
         return ""
-    cleaned = raw.replace(",", "").strip()
-    return cleaned
+    return raw.translate(_STRIP_COMMAS).strip()
+
+
+def _format_cents_grouped(cents: int, negative: bool) -> str:
+    # int.__format__ groups digits in C; Decimal's grouped formatting is several times slower.
+    whole, frac = divmod(abs(cents), 100)
+    sign = "-" if negative else ""
+    return f"{sign}{whole:,}.{frac:02d}"
+
+
+def _format_decimal(value: Decimal) -> str:
+    # Non-finite values skip the cache: hashing a signalling NaN raises.
+    if not value.is_finite():
+        return f"{value:,.2f}"
+    # -0 and 0 compare and hash equal, so the sign must be part of the cache key.
+    return _format_finite_decimal(value, value.is_signed())
+
+
+@lru_cache(maxsize=1024)
+def _format_finite_decimal(value: Decimal, negative: bool) -> str:
+    # to_integral_value rounds half-even, like Decimal's own two-place formatting.
+    cents = int(value.scaleb(2).to_integral_value())
+    return _format_cents_grouped(cents, negative)
 
 
 def format_amount_display(value: Decimal | str) -> str:
     if isinstance(value, Decimal):
-        return f"{value:,.2f}"
+        return _format_decimal(value)
     sanitized = sanitize_amount_input(value)
     if not sanitized:
         return ""
@@ -71,7 +241,51 @@ def format_amount_display(value: Decimal | str) -> str:
         amount = Decimal(sanitized)
     except InvalidOperation:
         return value.strip()
-    return f"{amount:,.2f}"
+    return _format_decimal(amount)
+
+
+TableRows = Dict[str, Tuple[str, ...]]
+
+
+def replace_tree_rows(tree: ttk.Treeview, rows: TableRows) -> None:
+    """Replace every row of ``tree`` with ``rows``, an ordered mapping of iid to values."""
+    flat: List[object] = []
+    for item in rows.items():
+        flat += item
+    tree.tk.call("apply", _REPLACE_ROWS, tree._w, tuple(flat))
+
+
+def sync_tree_rows(tree: ttk.Treeview, previous: TableRows, rows: TableRows) -> None:
+    """Bring ``tree`` from ``previous`` to ``rows`` touching only the rows that differ.
+
+    Unchanged rows keep their items, so selection and scroll position survive a refresh.
+    An empty table, or surviving rows that changed their relative order, is rebuilt instead.
+    """
+    kept = [iid for iid in previous if iid in rows]
+    if not kept or [iid for iid in rows if iid in previous] != kept:
+        replace_tree_rows(tree, rows)
+        return
+    removed = [iid for iid in previous if iid not in rows]
+    if removed:
+        tree.delete(*removed)
+    for index, (iid, values) in enumerate(rows.items()):
+        old_values = previous.get(iid)
+        if old_values is None:
+            tree.insert("", index, iid=iid, values=values)
+        elif old_values != values:
+            tree.item(iid, values=values)
+
+
+@lru_cache(maxsize=4096)
+def _display_amount(currency: str, amount_cents: int) -> str:
+    # Rows repeat across refreshes, so each distinct amount is only converted and grouped once.
+    return f"{currency} {_format_cents_grouped(amount_cents, amount_cents < 0)}"
+
+
+@lru_cache(maxsize=4096)
+def _display_datetime(value: datetime) -> str:
+    date_part, time_part = _date_time_parts(value.astimezone(timezone.utc))
+    return f"{date_part} {time_part}"
 
 
 def parse_user_datetime(value: str) -> datetime:
@@ -83,138 +297,66 @@ def parse_user_datetime(value: str) -> datetime:
     return parse_datetime(normalized)
 
 
-class ExpenseTab(ttk.Frame):
-    """UI for managing expenses."""
+class _LedgerTabBase(ttk.Frame, ABC):
+    """Shared form and table for the expense and income tabs.
 
-    def __init__(
-        self,
-        master: tk.Misc,
-        service: ExpenseService,
-        category_service: CategoryService,
-        on_change: Callable[[], None],
-    ) -> None:
+    Subclasses describe their resource through the class attributes below and fill in
+    the form rows, payload fields and table values that differ between the two.
+    """
+
+    _title: str
+    _item_name: str
+    _date_field: str
+    _date_label: str
+    _invalid_date_message: str
+    _required_fields: Tuple[Tuple[str, str], ...]
+    _columns: Tuple[Tuple[str, str, int], ...]
+
+    # Free-text entries are read only on submit, so they skip the StringVar trace machinery.
+    description_entry: ttk.Entry
+    tags_entry: ttk.Entry
+
+    def __init__(self, master: tk.Misc, service: Any, on_change: Callable[[], None]) -> None:
         super().__init__(master, padding=16, style="Panel.TFrame")
         self.service = service
-        self.category_service = category_service
         self.on_change = on_change
 
         self.amount_var = tk.StringVar()
         self.currency_var = tk.StringVar(value="USD")
-        self.category_var = tk.StringVar()
-        self.payment_var = tk.StringVar(value=sorted(PAYMENT_METHODS)[0])
         current_date, current_time = _current_date_time()
-        self.incurred_date_var = tk.StringVar(value=current_date)
-        self.incurred_time_var = tk.StringVar(value=current_time)
-        self.description_var = tk.StringVar()
-        self.merchant_var = tk.StringVar()
-        self.tags_var = tk.StringVar()
-
-        self.categories: List[Category] = []
-        self.category_combo: Optional[ttk.Combobox] = None
-        self.add_category_button: Optional[ttk.Button] = None
-        self.delete_category_button: Optional[ttk.Button] = None
-        self.refresh_category_button: Optional[ttk.Button] = None
-
+        self.date_var = tk.StringVar(value=current_date)
+        self.time_var = tk.StringVar(value=current_time)
+        self._rows: TableRows = {}
+        self._realized = False
+
+    def realize(self) -> None:
+        """Build the widgets and fill the table the first time the tab is shown."""
+        if self._realized:
+            return
+        self._realized = True
         self._build_form()
         self._build_table()
         self.columnconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
-
-        self._reload_categories(preserve_selection=False)
+        self.populate()
 
     def _build_form(self) -> None:
-        form = ttk.LabelFrame(self, text="Add Expense", style="Card.TLabelframe")
+        form = ttk.LabelFrame(self, text=f"Add {self._title}", style="Card.TLabelframe")
         form.grid(row=0, column=0, sticky="ew", padx=4, pady=(0, 12))
         form.columnconfigure(0, weight=1)
         form.columnconfigure(1, weight=1)
 
-        def add_field(
-            label: str,
-            var: tk.StringVar,
-            column: int,
-            row: int,
-            *,
-            state: Optional[str] = None,
-        ) -> ttk.Entry:
-            ttk.Label(form, text=label, style="FormLabel.TLabel").grid(
-                column=column, row=row, sticky="w", padx=4, pady=4
-            )
-            entry = ttk.Entry(form, textvariable=var, style="App.TEntry")
-            if state:
-                entry.configure(state=state)
-            entry.grid(column=column, row=row + 1, sticky="ew", padx=4, pady=(0, 8))
-            return entry
-
-        amount_entry = add_field("Amount", self.amount_var, 0, 0)
+        amount_entry = self._add_field(form, "Amount", self.amount_var, 0, 0)
         amount_entry.bind("<FocusOut>", self._handle_amount_focus_out)
-
-        add_field("Currency", self.currency_var, 1, 0, state="readonly")
-
-        ttk.Label(form, text="Category", style="FormLabel.TLabel").grid(
-            column=0, row=2, sticky="w", padx=4, pady=4
-        )
-        category_frame = ttk.Frame(form, style="Panel.TFrame")
-        category_frame.grid(column=0, row=3, sticky="ew", padx=4, pady=(0, 8))
-        category_frame.columnconfigure(0, weight=1)
-
-        self.category_combo = ttk.Combobox(
-            category_frame,
-            textvariable=self.category_var,
-            values=[],
-            state="readonly",
-            style="App.TCombobox",
-        )
-        self.category_combo.grid(column=0, row=0, sticky="ew")
-
-        self.add_category_button = ttk.Button(
-            category_frame,
-            text="Add",
-            command=self._prompt_add_category,
-            style="Secondary.TButton",
-        )
-        self.add_category_button.grid(column=1, row=0, padx=4)
-
-        self.delete_category_button = ttk.Button(
-            category_frame,
-            text="Delete",
-            command=self._delete_selected_category,
-            style="Secondary.TButton",
-        )
-        self.delete_category_button.grid(column=2, row=0, padx=4)
-
-        self.refresh_category_button = ttk.Button(
-            category_frame,
-            text="Refresh",
-            command=lambda: self._reload_categories(preserve_selection=True),
-            style="Secondary.TButton",
-        )
-        self.refresh_category_button.grid(column=3, row=0, padx=4)
-
-        ttk.Label(form, text="Payment Method", style="FormLabel.TLabel").grid(
-            column=1, row=2, sticky="w", padx=4, pady=4
-        )
-        payment_combo = ttk.Combobox(
-            form,
-            textvariable=self.payment_var,
-            values=sorted(PAYMENT_METHODS),
-            state="readonly",
-            style="App.TCombobox",
-        )
-        payment_combo.grid(column=1, row=3, sticky="ew", padx=4, pady=(0, 8))
-
-        add_field("Incurred Date (YYYY-MM-DD)", self.incurred_date_var, 0, 4)
-        add_field("Incurred Time (HH:MM)", self.incurred_time_var, 1, 4)
-        add_field("Merchant", self.merchant_var, 0, 6)
-        add_field("Tags (comma separated)", self.tags_var, 1, 6)
-
-        ttk.Label(form, text="Description", style="FormLabel.TLabel").grid(
-            column=0, row=8, columnspan=2, sticky="w", padx=4, pady=4
-        )
-        desc_entry = ttk.Entry(form, textvariable=self.description_var, style="App.TEntry")
-        desc_entry.grid(column=0, row=9, columnspan=2, sticky="ew", padx=4, pady=(0, 8))
+        self._add_field(form, "Currency", self.currency_var, 1, 0, state="readonly")
+        # Widgets are created top to bottom so keyboard traversal follows the layout.
+        self._build_choice_fields(form)
+        self._add_field(form, f"{self._date_label} Date (YYYY-MM-DD)", self.date_var, 0, 4)
+        self._add_field(form, f"{self._date_label} Time (HH:MM)", self.time_var, 1, 4)
+        button_row_index = self._build_detail_fields(form)
 
         button_row = ttk.Frame(form, style="Panel.TFrame")
-        button_row.grid(column=0, row=10, columnspan=2, sticky="e", padx=4, pady=4)
+        button_row.grid(column=0, row=button_row_index, columnspan=2, sticky="e", padx=4, pady=4)
         ttk.Button(
             button_row,
             text="Reset",
@@ -223,34 +365,44 @@ class ExpenseTab(ttk.Frame):
         ).grid(column=0, row=0, padx=4)
         ttk.Button(
             button_row,
-            text="Add Expense",
+            text=f"Add {self._title}",
             command=self.submit,
             style="Primary.TButton",
         ).grid(column=1, row=0, padx=4)
 
+    @staticmethod
+    def _add_field(
+        form: ttk.LabelFrame,
+        label: str,
+        var: Optional[tk.StringVar],
+        column: int,
+        row: int,
+        *,
+        state: Optional[str] = None,
+    ) -> ttk.Entry:
+        ttk.Label(form, text=label, style="FormLabel.TLabel").grid(
+            column=column, row=row, sticky="w", padx=4, pady=4
+        )
+        entry = ttk.Entry(form, textvariable=var, style="App.TEntry")
+        if state:
+            entry.configure(state=state)
+        entry.grid(column=column, row=row + 1, sticky="ew", padx=4, pady=(0, 8))
+        return entry
+
     def _build_table(self) -> None:
         table_frame = ttk.Frame(self, style="Panel.TFrame")
         table_frame.grid(row=1, column=0, sticky="nsew")
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-        columns = ("date", "category", "amount", "payment", "merchant")
         self.tree = ttk.Treeview(
             table_frame,
-            columns=columns,
+            columns=tuple(key for key, _label, _width in self._columns),
             show="headings",
             height=10,
             style="App.Treeview",
         )
-        headings = {
-            "date": "Date",
-            "category": "Category",
-            "amount": "Amount",
-            "payment": "Payment",
-            "merchant": "Merchant",
-        }
-        for key, label in headings.items():
-            width = 140 if key != "amount" else 120
+        for key, label, width in self._columns:
             self.tree.heading(key, text=label, anchor="w")
             self.tree.column(key, width=width, anchor="w")
 
@@ -270,35 +422,38 @@ class ExpenseTab(ttk.Frame):
         ).grid(row=0, column=0, padx=4)
 
     def submit(self) -> None:
+        invalid_title = f"Invalid {self._title}"
         sanitized_amount = sanitize_amount_input(self.amount_var.get())
         try:
-            incurred_at = combine_date_time(self.incurred_date_var.get(), self.incurred_time_var.get())
+            occurred_dt = combine_date_time_dt(self.date_var.get(), self.time_var.get())
         except ValueError:
             messagebox.showerror(
-                "Invalid Expense", "Provide a valid incurred date and time.", parent=self
+                invalid_title,
+                f"Provide a valid {self._date_label.lower()} date and time.",
+                parent=self,
             )
             return
         payload = {
             "amount": sanitized_amount,
             "currency": (self.currency_var.get() or "USD").strip().upper(),
-            "category": self.category_var.get(),
-            "payment_method": self.payment_var.get(),
-            "incurred_at": incurred_at,
-            "description": self.description_var.get() or None,
-            "merchant": self.merchant_var.get() or None,
-            "tags": self._split_tags(self.tags_var.get()),
-            "receipt_image_path": None,
+            self._date_field: isoformat_utc(occurred_dt),
+            "description": self.description_entry.get() or None,
+            "tags": self._split_tags(self.tags_entry.get()),
         }
+        payload.update(self._form_payload())
 
-        errors = self._validate(payload)
+        errors = self._validate(payload, occurred_dt)
         if errors:
-            messagebox.showerror("Invalid Expense", "\n".join(errors), parent=self)
+            messagebox.showerror(invalid_title, "\n".join(errors), parent=self)
             return
 
         try:
             self.service.add(payload)
         except ValidationError as exc:
-            messagebox.showerror("Invalid Expense", str(exc), parent=self)
+            messagebox.showerror(invalid_title, str(exc), parent=self)
+            return
+        except PersistenceError as exc:
+            messagebox.showerror("Storage Error", str(exc), parent=self)
             return
 
         self.reset_form()
@@ -308,7 +463,9 @@ class ExpenseTab(ttk.Frame):
     def delete_selected(self) -> None:
         selection = self.tree.selection()
         if not selection:
-            messagebox.showinfo("No selection", "Please select an expense to delete.", parent=self)
+            messagebox.showinfo(
+                "No selection", f"Please select {self._item_name} to delete.", parent=self
+            )
             return
         for item_id in selection:
             try:
@@ -322,39 +479,30 @@ class ExpenseTab(ttk.Frame):
         self.on_change()
 
     def populate(self) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for expense in self.service.list():
-            data = expense.to_dict()
-            amount_display = f"{data['currency']} {format_amount_display(data['amount'])}"
-            try:
-                date_part, time_part = split_iso_datetime(data["incurred_at"])
-                incurred_display = f"{date_part} {time_part}"
-            except Exception:
-                incurred_display = data["incurred_at"]
-            merchant = data.get("merchant") or "-"
-            values = (
-                incurred_display,
-                data["category"],
-                amount_display,
-                data["payment_method"],
-                merchant if merchant else "-",
-            )
-            self.tree.insert("", "end", iid=data["id"], values=values)
+        if not self._realized:
+            # realize() fills the table when the tab is first shown.
+            return
+        row_values = self._row_values
+        rows: TableRows = {record.id: row_values(record) for record in self.service.list()}
+        sync_tree_rows(self.tree, self._rows, rows)
+        self._rows = rows
 
     def reset_form(self) -> None:
         self.amount_var.set("")
-        self.description_var.set("")
-        self.merchant_var.set("")
-        self.tags_var.set("")
+        self.description_entry.delete(0, "end")
+        self.tags_entry.delete(0, "end")
         current_date, current_time = _current_date_time()
-        self.incurred_date_var.set(current_date)
-        self.incurred_time_var.set(current_time)
-        self._reload_categories(preserve_selection=False)
+        self.date_var.set(current_date)
+        self.time_var.set(current_time)
 
     def _handle_amount_focus_out(self, _event: object) -> None:
+        # Let the focus change finish first; the reformat is cosmetic.
+        self.after_idle(self._reformat_amount)
+
+    def _reformat_amount(self) -> None:
         self.amount_var.set(format_amount_display(self.amount_var.get()))
 
-    def _validate(self, payload: dict) -> List[str]:
+    def _validate(self, payload: dict, occurred_dt: Optional[datetime] = None) -> List[str]:
         errors: List[str] = []
 
         amount_text = payload["amount"].strip()
@@ -369,31 +517,180 @@ class ExpenseTab(ttk.Frame):
                 if amount_value <= 0:
                     errors.append("Amount must be greater than zero.")
 
-        if not payload["category"].strip():
-            errors.append("Category is required.")
-
-        if not payload["payment_method"].strip():
-            errors.append("Payment method is required.")
+        for key, message in self._required_fields:
+            if not payload[key].strip():
+                errors.append(message)
 
-        incurred_text = (payload["incurred_at"] or "").strip()
-        if not incurred_text:
-            errors.append("Incurred date/time is required.")
-        else:
-            try:
-                incurred_dt = parse_user_datetime(incurred_text)
-            except Exception:
-                errors.append("Provide a valid incurred date and time.")
+        if occurred_dt is None:
+            # Callers that built the datetime themselves pass it in to skip re-parsing the string.
+            occurred_text = (payload[self._date_field] or "").strip()
+            if not occurred_text:
+                errors.append(f"{self._date_label} date/time is required.")
             else:
-                if incurred_dt > datetime.now(timezone.utc):
-                    errors.append("Incurred date cannot be in the future.")
+                try:
+                    occurred_dt = parse_user_datetime(occurred_text)
+                except Exception:
+                    errors.append(self._invalid_date_message)
+        if occurred_dt is not None and occurred_dt > datetime.now(timezone.utc):
+            errors.append(f"{self._date_label} date cannot be in the future.")
 
         return errors
 
     @staticmethod
     def _split_tags(raw: str) -> Optional[Iterable[str]]:
-        cleaned = [tag.strip() for tag in raw.split(",") if tag.strip()]
+        cleaned = [tag for tag in _TAG_SEPARATOR.split(raw.strip()) if tag]
         return cleaned if cleaned else None
 
+    @abstractmethod
+    def _build_choice_fields(self, form: ttk.LabelFrame) -> None:
+        """Lay out the resource-specific rows 2-3 between the amount and date rows."""
+
+    @abstractmethod
+    def _build_detail_fields(self, form: ttk.LabelFrame) -> int:
+        """Lay out the rows below the date and return the row for the buttons."""
+
+    @abstractmethod
+    def _form_payload(self) -> Dict[str, Any]:
+        """Collect the form fields into a service payload."""
+
+    @abstractmethod
+    def _row_values(self, record: Any) -> Tuple[str, ...]:
+        """Return the table cells shown for ``record``."""
+
+
+class ExpenseTab(_LedgerTabBase):
+    """UI for managing expenses."""
+
+    _title = "Expense"
+    _item_name = "an expense"
+    _date_field = "incurred_at"
+    _date_label = "Incurred"
+    _invalid_date_message = "Provide a valid incurred date and time."
+    _required_fields = (
+        ("category", "Category is required."),
+        ("payment_method", "Payment method is required."),
+    )
+    _columns = (
+        ("date", "Date", 140),
+        ("category", "Category", 140),
+        ("amount", "Amount", 120),
+        ("payment", "Payment", 140),
+        ("merchant", "Merchant", 140),
+    )
+    merchant_entry: ttk.Entry
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        service: ExpenseService,
+        category_service: CategoryService,
+        on_change: Callable[[], None],
+    ) -> None:
+        super().__init__(master, service, on_change)
+        self.category_service = category_service
+
+        self.category_var = tk.StringVar()
+        self.payment_var = tk.StringVar(value=_PAYMENT_METHODS_SORTED[0])
+
+        self.categories: List[Category] = []
+        self._category_by_name: Dict[str, Category] = {}
+        self.category_combo: Optional[ttk.Combobox] = None
+        self.add_category_button: Optional[ttk.Button] = None
+        self.delete_category_button: Optional[ttk.Button] = None
+        self.refresh_category_button: Optional[ttk.Button] = None
+        # Last values and states pushed to the category widgets, matching their initial options.
+        self._category_choices: Tuple[str, ...] = ()
+        self._combo_state = "readonly"
+        self._delete_state = "normal"
+
+    def _build_choice_fields(self, form: ttk.LabelFrame) -> None:
+        ttk.Label(form, text="Category", style="FormLabel.TLabel").grid(
+            column=0, row=2, sticky="w", padx=4, pady=4
+        )
+        category_frame = ttk.Frame(form, style="Panel.TFrame")
+        category_frame.grid(column=0, row=3, sticky="ew", padx=4, pady=(0, 8))
+        category_frame.columnconfigure(0, weight=1)
+
+        self.category_combo = ttk.Combobox(
+            category_frame,
+            textvariable=self.category_var,
+            values=[],
+            state="readonly",
+            style="App.TCombobox",
+        )
+        self.category_combo.grid(column=0, row=0, sticky="ew")
+
+        self.add_category_button = ttk.Button(
+            category_frame,
+            text="Add",
+            command=self._prompt_add_category,
+            style="Secondary.TButton",
+        )
+        self.add_category_button.grid(column=1, row=0, padx=4)
+
+        self.delete_category_button = ttk.Button(
+            category_frame,
+            text="Delete",
+            command=self._delete_selected_category,
+            style="Secondary.TButton",
+        )
+        self.delete_category_button.grid(column=2, row=0, padx=4)
+
+        self.refresh_category_button = ttk.Button(
+            category_frame,
+            text="Refresh",
+            command=lambda: self._reload_categories(preserve_selection=True),
+            style="Secondary.TButton",
+        )
+        self.refresh_category_button.grid(column=3, row=0, padx=4)
+
+        ttk.Label(form, text="Payment Method", style="FormLabel.TLabel").grid(
+            column=1, row=2, sticky="w", padx=4, pady=4
+        )
+        payment_combo = ttk.Combobox(
+            form,
+            textvariable=self.payment_var,
+            values=_PAYMENT_METHODS_SORTED,
+            state="readonly",
+            style="App.TCombobox",
+        )
+        payment_combo.grid(column=1, row=3, sticky="ew", padx=4, pady=(0, 8))
+        self._reload_categories(preserve_selection=False)
+
+    def _build_detail_fields(self, form: ttk.LabelFrame) -> int:
+        self.merchant_entry = self._add_field(form, "Merchant", None, 0, 6)
+        self.tags_entry = self._add_field(form, "Tags (comma separated)", None, 1, 6)
+
+        ttk.Label(form, text="Description", style="FormLabel.TLabel").grid(
+            column=0, row=8, columnspan=2, sticky="w", padx=4, pady=4
+        )
+        self.description_entry = ttk.Entry(form, style="App.TEntry")
+        self.description_entry.grid(column=0, row=9, columnspan=2, sticky="ew", padx=4, pady=(0, 8))
+        return 10
+
+    def _form_payload(self) -> Dict[str, Any]:
+        return {
+            "category": self.category_var.get(),
+            "payment_method": self.payment_var.get(),
+            "merchant": self.merchant_entry.get() or None,
+            "receipt_image_path": None,
+        }
+
+    def _row_values(self, expense: Expense) -> Tuple[str, ...]:
+        # Read the model attributes directly rather than going through to_dict().
+        return (
+            _display_datetime(expense.incurred_at),
+            expense.category,
+            _display_amount(expense.currency, expense.amount_cents),
+            expense.payment_method,
+            expense.merchant or "-",
+        )
+
+    def reset_form(self) -> None:
+        super().reset_form()
+        self.merchant_entry.delete(0, "end")
+        self._reload_categories(preserve_selection=False)
+
     def _reload_categories(self, preserve_selection: bool = True) -> None:
         previous = self.category_var.get().strip()
         try:
@@ -409,19 +706,29 @@ class ExpenseTab(ttk.Frame):
             categories = []
 
         self.categories = categories
-        names = [category.name for category in categories]
+        self._category_by_name = {category.name: category for category in categories}
+        names = list(self._category_by_name)
         if preserve_selection and previous and previous not in names:
             names.insert(0, previous)
 
         if self.category_combo is not None:
-            self.category_combo["values"] = names
-            if names:
-                self.category_combo.configure(state="readonly")
-            else:
-                self.category_combo.configure(state="disabled")
+            # Send only what changed, in one configure call; identical values still make Tk
+            # reparse the list.
+            combo_options: Dict[str, Any] = {}
+            choices = tuple(names)
+            if choices != self._category_choices:
+                combo_options["values"] = self._category_choices = choices
+            combo_state = "readonly" if names else "disabled"
+            if combo_state != self._combo_state:
+                combo_options["state"] = self._combo_state = combo_state
+            if combo_options:
+                self.category_combo.configure(**combo_options)
 
         if self.delete_category_button is not None:
-            self.delete_category_button.configure(state="normal" if categories else "disabled")
+            delete_state = "normal" if categories else "disabled"
+            if delete_state != self._delete_state:
+                self.delete_category_button.configure(state=delete_state)
+                self._delete_state = delete_state
 
         if names:
             if preserve_selection and previous in names:
@@ -460,7 +767,7 @@ class ExpenseTab(ttk.Frame):
             messagebox.showinfo("No Category", "Select a category to delete.", parent=self)
             return
 
-        category = next((item for item in self.categories if item.name == name), None)
+        category = self._category_by_name.get(name)
         if category is None:
             messagebox.showwarning(
                 "Category Missing",
@@ -501,62 +808,37 @@ class ExpenseTab(ttk.Frame):
         self._reload_categories(preserve_selection=False)
 
 
-class IncomeTab(ttk.Frame):
+class IncomeTab(_LedgerTabBase):
     """UI for managing incomes."""
 
+    _title = "Income"
+    _item_name = "an income"
+    _date_field = "received_at"
+    _date_label = "Received"
+    _invalid_date_message = "Received date must be a valid ISO 8601 datetime."
+    _required_fields = (
+        ("source", "Source is required."),
+        ("received_method", "Received method is required."),
+    )
+    _columns = (
+        ("date", "Date", 150),
+        ("source", "Source", 150),
+        ("method", "Method", 150),
+        ("amount", "Amount", 120),
+    )
+
     def __init__(
         self,
         master: tk.Misc,
         service: IncomeService,
         on_change: Callable[[], None],
     ) -> None:
-        super().__init__(master, padding=16, style="Panel.TFrame")
-        self.service = service
-        self.on_change = on_change
-
-        self.amount_var = tk.StringVar()
-        self.currency_var = tk.StringVar(value="USD")
+        super().__init__(master, service, on_change)
         self.source_var = tk.StringVar()
-        self.method_var = tk.StringVar(value=sorted(INCOME_METHODS)[0])
-        current_date, current_time = _current_date_time()
-        self.received_date_var = tk.StringVar(value=current_date)
-        self.received_time_var = tk.StringVar(value=current_time)
-        self.description_var = tk.StringVar()
-        self.tags_var = tk.StringVar()
-
-        self._build_form()
-        self._build_table()
-        self.columnconfigure(0, weight=1)
-        self.rowconfigure(1, weight=1)
+        self.method_var = tk.StringVar(value=_INCOME_METHODS_SORTED[0])
 
-    def _build_form(self) -> None:
-        form = ttk.LabelFrame(self, text="Add Income", style="Card.TLabelframe")
-        form.grid(row=0, column=0, sticky="ew", padx=4, pady=(0, 12))
-        form.columnconfigure(0, weight=1)
-        form.columnconfigure(1, weight=1)
-
-        def add_field(
-            label: str,
-            var: tk.StringVar,
-            column: int,
-            row: int,
-            *,
-            state: Optional[str] = None,
-        ) -> ttk.Entry:
-            ttk.Label(form, text=label, style="FormLabel.TLabel").grid(
-                column=column, row=row, sticky="w", padx=4, pady=4
-            )
-            entry = ttk.Entry(form, textvariable=var, style="App.TEntry")
-            if state:
-                entry.configure(state=state)
-            entry.grid(column=column, row=row + 1, sticky="ew", padx=4, pady=(0, 8))
-            return entry
-
-        amount_entry = add_field("Amount", self.amount_var, 0, 0)
-        amount_entry.bind("<FocusOut>", self._handle_amount_focus_out)
-
-        add_field("Currency", self.currency_var, 1, 0, state="readonly")
-        add_field("Source", self.source_var, 0, 2)
+    def _build_choice_fields(self, form: ttk.LabelFrame) -> None:
+        self._add_field(form, "Source", self.source_var, 0, 2)
 
         ttk.Label(form, text="Received Method", style="FormLabel.TLabel").grid(
             column=1, row=2, sticky="w", padx=4, pady=4
@@ -564,195 +846,35 @@ class IncomeTab(ttk.Frame):
         method_combo = ttk.Combobox(
             form,
             textvariable=self.method_var,
-            values=sorted(INCOME_METHODS),
+            values=_INCOME_METHODS_SORTED,
             state="readonly",
             style="App.TCombobox",
         )
         method_combo.grid(column=1, row=3, sticky="ew", padx=4, pady=(0, 8))
 
-        add_field("Received Date (YYYY-MM-DD)", self.received_date_var, 0, 4)
-        add_field("Received Time (HH:MM)", self.received_time_var, 1, 4)
-        add_field("Description", self.description_var, 0, 6)
-        add_field("Tags (comma separated)", self.tags_var, 1, 6)
+    def _build_detail_fields(self, form: ttk.LabelFrame) -> int:
+        self.description_entry = self._add_field(form, "Description", None, 0, 6)
+        self.tags_entry = self._add_field(form, "Tags (comma separated)", None, 1, 6)
+        return 8
 
-        button_row = ttk.Frame(form, style="Panel.TFrame")
-        button_row.grid(column=0, row=8, columnspan=2, sticky="e", padx=4, pady=4)
-        ttk.Button(
-            button_row,
-            text="Reset",
-            command=self.reset_form,
-            style="Secondary.TButton",
-        ).grid(column=0, row=0, padx=4)
-        ttk.Button(
-            button_row,
-            text="Add Income",
-            command=self.submit,
-            style="Primary.TButton",
-        ).grid(column=1, row=0, padx=4)
-
-    def _build_table(self) -> None:
-        table_frame = ttk.Frame(self, style="Panel.TFrame")
-        table_frame.grid(row=1, column=0, sticky="nsew")
-        table_frame.columnconfigure(0, weight=1)
-        table_frame.rowconfigure(0, weight=1)
-
-        columns = ("date", "source", "method", "amount")
-        self.tree = ttk.Treeview(
-            table_frame,
-            columns=columns,
-            show="headings",
-            height=10,
-            style="App.Treeview",
-        )
-        headings = {
-            "date": "Date",
-            "source": "Source",
-            "method": "Method",
-            "amount": "Amount",
-        }
-        for key, label in headings.items():
-            width = 150 if key != "amount" else 120
-            self.tree.heading(key, text=label, anchor="w")
-            self.tree.column(key, width=width, anchor="w")
-
-        vsb = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscroll=vsb.set)
-
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-
-        button_bar = ttk.Frame(table_frame, style="Panel.TFrame")
-        button_bar.grid(row=1, column=0, columnspan=2, sticky="e", pady=8)
-        ttk.Button(
-            button_bar,
-            text="Delete Selected",
-            command=self.delete_selected,
-            style="Secondary.TButton",
-        ).grid(row=0, column=0, padx=4)
-
-    def submit(self) -> None:
-        sanitized_amount = sanitize_amount_input(self.amount_var.get())
-        try:
-            received_at = combine_date_time(self.received_date_var.get(), self.received_time_var.get())
-        except ValueError:
-            messagebox.showerror(
-                "Invalid Income", "Provide a valid received date and time.", parent=self
-            )
-            return
-        payload = {
-            "amount": sanitized_amount,
-            "currency": (self.currency_var.get() or "USD").strip().upper(),
+    def _form_payload(self) -> Dict[str, Any]:
+        return {
             "source": self.source_var.get(),
             "received_method": self.method_var.get(),
-            "received_at": received_at,
-            "description": self.description_var.get() or None,
-            "tags": self._split_tags(self.tags_var.get()),
             "attachment_path": None,
         }
 
-        errors = self._validate(payload)
-        if errors:
-            messagebox.showerror("Invalid Income", "\n".join(errors), parent=self)
-            return
-
-        try:
-            self.service.add(payload)
-        except ValidationError as exc:
-            messagebox.showerror("Invalid Income", str(exc), parent=self)
-            return
-        except PersistenceError as exc:
-            messagebox.showerror("Storage Error", str(exc), parent=self)
-            return
-
-        self.reset_form()
-        self.populate()
-        self.on_change()
-
-    def delete_selected(self) -> None:
-        selection = self.tree.selection()
-        if not selection:
-            messagebox.showinfo("No selection", "Please select an income to delete.", parent=self)
-            return
-        for item_id in selection:
-            try:
-                self.service.delete(item_id)
-            except RecordNotFoundError as exc:
-                messagebox.showwarning("Not Found", str(exc), parent=self)
-            except PersistenceError as exc:
-                messagebox.showerror("Storage Error", str(exc), parent=self)
-                break
-        self.populate()
-        self.on_change()
-
-    def populate(self) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for income in self.service.list():
-            data = income.to_dict()
-            amount_display = f"{data['currency']} {format_amount_display(data['amount'])}"
-            try:
-                date_part, time_part = split_iso_datetime(data["received_at"])
-                received_display = f"{date_part} {time_part}"
-            except Exception:
-                received_display = data["received_at"]
-            values = (
-                received_display,
-                data["source"],
-                data["received_method"],
-                amount_display,
-            )
-            self.tree.insert("", "end", iid=data["id"], values=values)
+    def _row_values(self, income: Income) -> Tuple[str, ...]:
+        return (
+            _display_datetime(income.received_at),
+            income.source,
+            income.received_method,
+            _display_amount(income.currency, income.amount_cents),
+        )
 
     def reset_form(self) -> None:
-        self.amount_var.set("")
+        super().reset_form()
         self.source_var.set("")
-        self.description_var.set("")
-        self.tags_var.set("")
-        current_date, current_time = _current_date_time()
-        self.received_date_var.set(current_date)
-        self.received_time_var.set(current_time)
-
-    def _handle_amount_focus_out(self, _event: object) -> None:
-        self.amount_var.set(format_amount_display(self.amount_var.get()))
-
-    def _validate(self, payload: dict) -> List[str]:
-        errors: List[str] = []
-
-        amount_text = payload["amount"].strip()
-        if not amount_text:
-            errors.append("Amount is required.")
-        else:
-            try:
-                amount_value = Decimal(amount_text)
-            except InvalidOperation:
-                errors.append("Amount must be a number.")
-            else:
-                if amount_value <= 0:
-                    errors.append("Amount must be greater than zero.")
-
-        if not payload["source"].strip():
-            errors.append("Source is required.")
-
-        if not payload["received_method"].strip():
-            errors.append("Received method is required.")
-
-        received_text = (payload["received_at"] or "").strip()
-        if not received_text:
-            errors.append("Received date/time is required.")
-        else:
-            try:
-                received_dt = parse_user_datetime(received_text)
-            except Exception:
-                errors.append("Received date must be a valid ISO 8601 datetime.")
-            else:
-                if received_dt > datetime.now(timezone.utc):
-                    errors.append("Received date cannot be in the future.")
-
-        return errors
-
-    @staticmethod
-    def _split_tags(raw: str) -> Optional[Iterable[str]]:
-        cleaned = [tag.strip() for tag in raw.split(",") if tag.strip()]
-        return cleaned if cleaned else None
 
 
 class ExpenseTrackerApp(tk.Tk):
@@ -776,131 +898,25 @@ class ExpenseTrackerApp(tk.Tk):
         self.expense_total_var = tk.StringVar(value="0.00")
         self.income_total_var = tk.StringVar(value="0.00")
         self.balance_var = tk.StringVar(value="0.00")
+        self._summary_vars = (self.expense_total_var, self.income_total_var, self.balance_var)
+        self._summary_texts: Tuple[str, ...] = ("0.00", "0.00", "0.00")
+        self._balance_negative: Optional[bool] = None
 
         self._build_layout()
         self.refresh_all()
 
     def _configure_styles(self) -> None:
+        # ttk styles belong to the Tcl interpreter, so theme each interpreter only once.
+        if self.tk.call("info", "exists", _STYLED_FLAG):
+            return
         style = ttk.Style(self)
         try:
             style.theme_use("clam")
         except tk.TclError:
             pass
 
-        style.configure("TFrame", background=PRIMARY_BG)
-        style.configure("TLabel", background=PRIMARY_BG, foreground=TEXT_PRIMARY)
-
-        style.configure("Panel.TFrame", background=SECONDARY_BG, relief="flat")
-        style.configure("Card.TLabelframe", background=SECONDARY_BG, foreground=TEXT_PRIMARY)
-        style.configure("Card.TLabelframe.Label", background=SECONDARY_BG, foreground=TEXT_PRIMARY)
-        style.configure("Header.TFrame", background=PRIMARY_BG)
-        style.configure("Summary.TFrame", background=SECONDARY_BG)
-        style.configure("Metric.TFrame", background=SECONDARY_BG)
-
-        style.configure("FormLabel.TLabel", background=SECONDARY_BG, foreground=TEXT_MUTED, font=("Segoe UI", 9))
-        style.configure("Header.TLabel", background=PRIMARY_BG, foreground=TEXT_PRIMARY, font=("Segoe UI", 20, "bold"))
-        style.configure("MetricLabel.TLabel", background=SECONDARY_BG, foreground=TEXT_MUTED, font=("Segoe UI", 9, "bold"))
-        style.configure("MetricValue.TLabel", background=SECONDARY_BG, foreground=TEXT_PRIMARY, font=("Segoe UI", 16, "bold"))
-        style.configure(
-            "MetricNegative.TFrame",
-            background="#321524",
-            bordercolor="#f87171",
-            relief="solid",
-            borderwidth=1,
-        )
-        style.configure(
-            "MetricValueNegative.TLabel",
-            background="#321524",
-            foreground="#fca5a5",
-            font=("Segoe UI", 16, "bold"),
-        )
-
-        style.configure(
-            "App.TEntry",
-            fieldbackground=SECONDARY_BG,
-            background=SECONDARY_BG,
-            foreground=TEXT_PRIMARY,
-            insertcolor=TEXT_PRIMARY,
-            bordercolor=ACCENT_BG,
-        )
-        style.map(
-            "App.TEntry",
-            fieldbackground=[("focus", SECONDARY_BG)],
-            foreground=[("disabled", TEXT_MUTED)],
-        )
-
-        style.configure(
-            "App.TCombobox",
-            fieldbackground=SECONDARY_BG,
-            background=SECONDARY_BG,
-            foreground=TEXT_PRIMARY,
-            arrowcolor=TEXT_PRIMARY,
-        )
-        style.map(
-            "App.TCombobox",
-            fieldbackground=[("readonly", SECONDARY_BG)],
-            foreground=[("disabled", TEXT_MUTED)],
-        )
-
-        style.configure(
-            "Primary.TButton",
-            background=ACCENT_BG,
-            foreground=TEXT_PRIMARY,
-            bordercolor=ACCENT_BG,
-            focustcolor=TEXT_PRIMARY,
-            padding=(18, 6),
-        )
-        style.map(
-            "Primary.TButton",
-            background=[("active", ACCENT_ACTIVE_BG)],
-            foreground=[("disabled", TEXT_MUTED)],
-        )
-
-        style.configure(
-            "Secondary.TButton",
-            background=SECONDARY_BG,
-            foreground=TEXT_PRIMARY,
-            bordercolor=SECONDARY_BG,
-            padding=(14, 6),
-        )
-        style.map(
-            "Secondary.TButton",
-            background=[("active", ACCENT_BG)],
-            foreground=[("disabled", TEXT_MUTED)],
-        )
-
-        style.configure(
-            "App.Treeview",
-            background=SECONDARY_BG,
-            fieldbackground=SECONDARY_BG,
-            foreground=TEXT_PRIMARY,
-            bordercolor=SECONDARY_BG,
-            rowheight=28,
-        )
-        style.configure(
-            "App.Treeview.Heading",
-            background=SECONDARY_BG,
-            foreground=TEXT_MUTED,
-            relief="flat",
-        )
-        style.map(
-            "App.Treeview",
-            background=[("selected", ACCENT_BG)],
-            foreground=[("selected", TEXT_PRIMARY)],
-        )
-
-        style.configure("App.TNotebook", background=PRIMARY_BG, borderwidth=0)
-        style.configure(
-            "App.TNotebook.Tab",
-            background=SECONDARY_BG,
-            foreground=TEXT_MUTED,
-            padding=(16, 10),
-        )
-        style.map(
-            "App.TNotebook.Tab",
-            background=[("selected", ACCENT_BG)],
-            foreground=[("selected", TEXT_PRIMARY)],
-        )
+        # The whole theme, and the flag marking it applied, go over in a single Tcl evaluation.
+        self.tk.eval(_THEME_SCRIPT)
 
     def _build_layout(self) -> None:
         self.columnconfigure(0, weight=1)
@@ -934,6 +950,12 @@ class ExpenseTrackerApp(tk.Tk):
 
         notebook.add(self.expense_tab, text="Expenses", padding=4)
         notebook.add(self.income_tab, text="Income", padding=4)
+        # Tabs build their widgets lazily; only the visible one is realised at startup.
+        self.expense_tab.realize()
+        notebook.bind(
+            "<<NotebookTabChanged>>",
+            lambda _event: notebook.nametowidget(notebook.select()).realize(),
+        )
 
     def refresh_all(self) -> None:
         self.expense_tab.populate()
@@ -943,16 +965,29 @@ class ExpenseTrackerApp(tk.Tk):
     def refresh_summary(self) -> None:
         expenses_total = self.expenses.total()
         incomes_total = self.incomes.total()
-        balance = self.ledger.balance()
-        self.expense_total_var.set(format_amount_display(expenses_total))
-        self.income_total_var.set(format_amount_display(incomes_total))
-        self.balance_var.set(format_amount_display(balance))
-        if balance < 0:
-            self.balance_container.configure(style="MetricNegative.TFrame")
-            self.balance_value_label.configure(style="MetricValueNegative.TLabel")
-        else:
-            self.balance_container.configure(style="Metric.TFrame")
-            self.balance_value_label.configure(style="MetricValue.TLabel")
+        # Unfiltered, the ledger balance is just the difference of the two totals already in hand.
+        balance = incomes_total - expenses_total
+        texts = (
+            format_amount_display(expenses_total),
+            format_amount_display(incomes_total),
+            format_amount_display(balance),
+        )
+        # Setting a StringVar fires Tcl traces and redraws its label even for the same text.
+        if texts != self._summary_texts:
+            for var, text, previous in zip(self._summary_vars, texts, self._summary_texts):
+                if text != previous:
+                    var.set(text)
+            self._summary_texts = texts
+        negative = balance < 0
+        # Restyling makes ttk recompute the widget layout; only do it when the sign flips.
+        if negative != self._balance_negative:
+            self._balance_negative = negative
+            if negative:
+                self.balance_container.configure(style="MetricNegative.TFrame")
+                self.balance_value_label.configure(style="MetricValueNegative.TLabel")
+            else:
+                self.balance_container.configure(style="Metric.TFrame")
+                self.balance_value_label.configure(style="MetricValue.TLabel")
 
 
 def main(argv: Optional[Iterable[str]] = None) -> None:
@@ -3,43 +3,93 @@
 from __future__ import annotations
 
 import argparse
+import re
 import sys
+from contextlib import nullcontext
 from datetime import datetime
-from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from common.exceptions import PersistenceError, RecordNotFoundError, ValidationError
-from common.services import ExpenseService, IncomeService, LedgerService
-from common.storage import JSONStorage
 
-DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+if TYPE_CHECKING:
+    from common.services import ExpenseService, IncomeService, LedgerService
 
-def _parse_datetime(value: str) -> str:
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_PLAIN_AMOUNT = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+def _datetime_error(value: str) -> Optional[str]:
+    """Return why ``value`` is not a YYYY-MM-DDTHH:MM:SS datetime, or None when it is."""
+    # fromisoformat is far cheaper than strptime; only trust it for the exact zero-padded
+    # YYYY-MM-DDTHH:MM:SS shape and let strptime judge everything else.
+    if (
+        len(value) == 19
+        and value[10] == "T"
+        and value[4] == value[7] == "-"
+        and value[13] == value[16] == ":"
+    ):
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            return None
     try:
         datetime.strptime(value, DATETIME_FORMAT)
-    except ValueError as exc:
-        raise argparse.ArgumentTypeError(
-            f"Invalid datetime '{value}'. Expected format YYYY-MM-DDTHH:MM:SS."
-        ) from exc
-    return value
+    except ValueError:
+        return f"Invalid datetime '{value}'. Expected format YYYY-MM-DDTHH:MM:SS."
+    return None
+
 
+def _amount_error(value: str) -> Optional[str]:
+    """Return why ``value`` is not a positive amount, or None when it is."""
+    # Plain unsigned decimals are the norm; they are positive exactly when a digit is non-zero.
+    if _PLAIN_AMOUNT.fullmatch(value):
+        return "Amount must be greater than zero" if value.strip("0.") == "" else None
+
+    from decimal import Decimal
 
-def _parse_amount(value: str) -> str:
     try:
         amount = Decimal(value)
-    except Exception as exc:  # pragma: no cover - delegated to service
-        raise argparse.ArgumentTypeError("Amount must be a numeric value") from exc
+    except Exception:  # pragma: no cover - delegated to service
+        return "Amount must be a numeric value"
     if amount <= 0:
-        raise argparse.ArgumentTypeError("Amount must be greater than zero")
-    return value
+        return "Amount must be greater than zero"
+    return None
+
+
+class _DateTimeAction(argparse.Action):
+    """Store a datetime argument as given once it has been checked."""
 
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        # Reporting through ArgumentError directly skips argparse's type= conversion wrapper.
+        error = _datetime_error(values)
+        if error is not None:
+            raise argparse.ArgumentError(self, error)
+        setattr(namespace, self.dest, values)
 
-def _comma_join(items: Iterable[str]) -> str:
-    return ", ".join(items)
+
+class _AmountAction(argparse.Action):
+    """Store an amount argument as given once it has been checked."""
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        error = _amount_error(values)
+        if error is not None:
+            raise argparse.ArgumentError(self, error)
+        setattr(namespace, self.dest, values)
+
+
+def _drop_none(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``values`` without the options that were not given on the command line."""
+    return {key: value for key, value in values.items() if value is not None}
 
 
 def _load_services(data_dir: Path) -> Tuple[LedgerService, ExpenseService, IncomeService]:
+    # Deferred so --help and argument errors exit before the services and orjson are loaded.
+    from common.services import ExpenseService, IncomeService, LedgerService
+    from common.storage import JSONStorage
+
     storage = JSONStorage(data_dir)
     expenses = ExpenseService(storage)
     incomes = IncomeService(storage)
@@ -47,23 +97,70 @@ def _load_services(data_dir: Path) -> Tuple[LedgerService, ExpenseService, Incom
 
 
 def _format_expense(expense: Dict[str, Any]) -> str:
-    tags = _comma_join(expense.get("tags", [])) or "-"
-    merchant = expense.get("merchant") or "-"
+    return _render_expense(
+        expense["id"],
+        expense["incurred_at"],
+        expense["currency"],
+        expense["amount"],
+        expense["category"],
+        expense["payment_method"],
+        expense.get("merchant"),
+        expense.get("description"),
+        tuple(expense.get("tags", ())),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_expense(
+    expense_id: str,
+    incurred_at: str,
+    currency: str,
+    amount: str,
+    category: str,
+    payment_method: str,
+    merchant: Optional[str],
+    description: Optional[str],
+    tags: Tuple[str, ...],
+) -> str:
+    # Keyed on every rendered field, so an unchanged record re-listed in the same process
+    # is a cache hit and any edit naturally misses.
     return (
-        f"[{expense['id']}] {expense['incurred_at']} {expense['currency']} {expense['amount']}\n"
-        f"  Category: {expense['category']} | Payment: {expense['payment_method']} | Merchant: {merchant}\n"
-        f"  Description: {expense.get('description') or '-'}\n"
-        f"  Tags: {tags}\n"
+        f"[{expense_id}] {incurred_at} {currency} {amount}\n"
+        f"  Category: {category} | Payment: {payment_method} | Merchant: {merchant or '-'}\n"
+        f"  Description: {description or '-'}\n"
+        f"  Tags: {', '.join(tags) if tags else '-'}\n"
     )
 
 
 def _format_income(income: Dict[str, Any]) -> str:
-    tags = _comma_join(income.get("tags", [])) or "-"
+    return _render_income(
+        income["id"],
+        income["received_at"],
+        income["currency"],
+        income["amount"],
+        income["source"],
+        income["received_method"],
+        income.get("description"),
+        tuple(income.get("tags", ())),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_income(
+    income_id: str,
+    received_at: str,
+    currency: str,
+    amount: str,
+    source: str,
+    received_method: str,
+    description: Optional[str],
+    tags: Tuple[str, ...],
+) -> str:
     return (
-        f"[{income['id']}] {income['received_at']} {income['currency']} {income['amount']}\n"
-        f"  Source: {income['source']} | Method: {income['received_method']}\n"
-        f"  Description: {income.get('description') or '-'}\n"
-        f"  Tags: {tags}\n"
+        f"[{income_id}] {received_at} {currency} {amount}\n"
+        f"  Source: {source} | Method: {received_method}\n"
+        f"  Description: {description or '-'}\n"
+        f"  Tags: {', '.join(tags) if tags else '-'}\n"
     )
 
 
@@ -84,22 +181,23 @@ def handle_expense(args: argparse.Namespace, service: ExpenseService) -> None:
         expense = service.add(payload)
         print("Expense added:\n" + _format_expense(expense.to_dict()))
     elif args.command == "list":
-        filters = {
+        filters = _drop_none({
             "category": args.category,
             "payment_method": args.payment_method,
             "tag": args.tag,
             "start": args.start,
             "end": args.end,
             "merchant": args.merchant,
-        }
-        expenses = service.list(**{k: v for k, v in filters.items() if v is not None})
+        })
+        # One filtering pass yields both the rows and their total.
+        expenses, total = service.list_with_total(**filters)
         if not expenses:
             print("No expenses found.")
             return
-        total = service.total(**{k: v for k, v in filters.items() if v is not None})
-        print(f"Found {len(expenses)} expenses (total {total:.2f}):")
-        for expense in expenses:
-            print(_format_expense(expense.to_dict()))
+        # One write for the whole listing instead of a print per record.
+        blocks = [f"Found {len(expenses)} expenses (total {total:.2f}):"]
+        blocks.extend(_format_expense(expense.to_dict()) for expense in expenses)
+        sys.stdout.write("\n".join(blocks) + "\n")
     elif args.command == "edit":
         changes = {
             "amount": args.amount,
@@ -113,7 +211,7 @@ def handle_expense(args: argparse.Namespace, service: ExpenseService) -> None:
             "tags": args.tags,
             "receipt_image_path": args.receipt,
         }
-        cleaned = {k: v for k, v in changes.items() if v is not None}
+        cleaned = _drop_none(changes)
         expense = service.update(args.id, cleaned)
         print("Expense updated:\n" + _format_expense(expense.to_dict()))
     elif args.command == "delete":
@@ -137,21 +235,22 @@ def handle_income(args: argparse.Namespace, service: IncomeService) -> None:
         income = service.add(payload)
         print("Income added:\n" + _format_income(income.to_dict()))
     elif args.command == "list":
-        filters = {
+        filters = _drop_none({
             "source": args.source,
             "received_method": args.received_method,
             "tag": args.tag,
             "start": args.start,
             "end": args.end,
-        }
-        incomes = service.list(**{k: v for k, v in filters.items() if v is not None})
+        })
+        # One filtering pass yields both the rows and their total.
+        incomes, total = service.list_with_total(**filters)
         if not incomes:
             print("No incomes found.")
             return
-        total = service.total(**{k: v for k, v in filters.items() if v is not None})
-        print(f"Found {len(incomes)} incomes (total {total:.2f}):")
-        for income in incomes:
-            print(_format_income(income.to_dict()))
+        # One write for the whole listing instead of a print per record.
+        blocks = [f"Found {len(incomes)} incomes (total {total:.2f}):"]
+        blocks.extend(_format_income(income.to_dict()) for income in incomes)
+        sys.stdout.write("\n".join(blocks) + "\n")
     elif args.command == "edit":
         changes = {
             "amount": args.amount,
@@ -164,7 +263,7 @@ def handle_income(args: argparse.Namespace, service: IncomeService) -> None:
             "tags": args.tags,
             "attachment_path": args.attachment,
         }
-        cleaned = {k: v for k, v in changes.items() if v is not None}
+        cleaned = _drop_none(changes)
         income = service.update(args.id, cleaned)
         print("Income updated:\n" + _format_income(income.to_dict()))
     elif args.command == "delete":
@@ -173,13 +272,13 @@ def handle_income(args: argparse.Namespace, service: IncomeService) -> None:
 
 
 def handle_balance(args: argparse.Namespace, ledger: LedgerService) -> None:
-    filters = {k: v for k, v in {
+    filters = _drop_none({
         "start": args.start,
         "end": args.end,
         "category": args.category,
         "source": args.source,
         "tag": args.tag,
-    }.items() if v is not None}
+    })
     balance = ledger.balance(**filters)
     print(f"Net balance: {balance:.2f}")
 
@@ -199,12 +298,12 @@ def build_parser() -> argparse.ArgumentParser:
     expense_sub = expense_parser.add_subparsers(dest="command", required=True)
 
     expense_add = expense_sub.add_parser("add", help="Add a new expense")
-    expense_add.add_argument("amount", type=_parse_amount)
+    expense_add.add_argument("amount", action=_AmountAction)
     expense_add.add_argument("currency")
     expense_add.add_argument("category")
     expense_add.add_argument("payment_method")
-    expense_add.add_argument("incurred_at", type=_parse_datetime)
-    expense_add.add_argument("--recorded-at", dest="recorded_at", type=_parse_datetime)
+    expense_add.add_argument("incurred_at", action=_DateTimeAction)
+    expense_add.add_argument("--recorded-at", dest="recorded_at", action=_DateTimeAction)
     expense_add.add_argument("--description")
     expense_add.add_argument("--merchant")
     expense_add.add_argument("--tags", nargs="*", default=[])
@@ -214,18 +313,18 @@ def build_parser() -> argparse.ArgumentParser:
     expense_list.add_argument("--category")
     expense_list.add_argument("--payment-method")
     expense_list.add_argument("--tag")
-    expense_list.add_argument("--start", type=_parse_datetime)
-    expense_list.add_argument("--end", type=_parse_datetime)
+    expense_list.add_argument("--start", action=_DateTimeAction)
+    expense_list.add_argument("--end", action=_DateTimeAction)
     expense_list.add_argument("--merchant")
 
     expense_edit = expense_sub.add_parser("edit", help="Edit an existing expense")
     expense_edit.add_argument("id")
-    expense_edit.add_argument("--amount", type=_parse_amount)
+    expense_edit.add_argument("--amount", action=_AmountAction)
     expense_edit.add_argument("--currency")
     expense_edit.add_argument("--category")
     expense_edit.add_argument("--payment-method")
-    expense_edit.add_argument("--incurred-at", type=_parse_datetime)
-    expense_edit.add_argument("--recorded-at", type=_parse_datetime)
+    expense_edit.add_argument("--incurred-at", action=_DateTimeAction)
+    expense_edit.add_argument("--recorded-at", action=_DateTimeAction)
     expense_edit.add_argument("--description")
     expense_edit.add_argument("--merchant")
     expense_edit.add_argument("--tags", nargs="*")
@@ -238,12 +337,12 @@ def build_parser() -> argparse.ArgumentParser:
     income_sub = income_parser.add_subparsers(dest="command", required=True)
 
     income_add = income_sub.add_parser("add", help="Add a new income")
-    income_add.add_argument("amount", type=_parse_amount)
+    income_add.add_argument("amount", action=_AmountAction)
     income_add.add_argument("currency")
     income_add.add_argument("source")
     income_add.add_argument("received_method")
-    income_add.add_argument("received_at", type=_parse_datetime)
-    income_add.add_argument("--recorded-at", dest="recorded_at", type=_parse_datetime)
+    income_add.add_argument("received_at", action=_DateTimeAction)
+    income_add.add_argument("--recorded-at", dest="recorded_at", action=_DateTimeAction)
     income_add.add_argument("--description")
     income_add.add_argument("--tags", nargs="*", default=[])
     income_add.add_argument("--attachment")
@@ -252,17 +351,17 @@ def build_parser() -> argparse.ArgumentParser:
     income_list.add_argument("--source")
     income_list.add_argument("--received-method")
     income_list.add_argument("--tag")
-    income_list.add_argument("--start", type=_parse_datetime)
-    income_list.add_argument("--end", type=_parse_datetime)
+    income_list.add_argument("--start", action=_DateTimeAction)
+    income_list.add_argument("--end", action=_DateTimeAction)
 
     income_edit = income_sub.add_parser("edit", help="Edit an existing income")
     income_edit.add_argument("id")
-    income_edit.add_argument("--amount", type=_parse_amount)
+    income_edit.add_argument("--amount", action=_AmountAction)
     income_edit.add_argument("--currency")
     income_edit.add_argument("--source")
     income_edit.add_argument("--received-method")
-    income_edit.add_argument("--received-at", type=_parse_datetime)
-    income_edit.add_argument("--recorded-at", type=_parse_datetime)
+    income_edit.add_argument("--received-at", action=_DateTimeAction)
+    income_edit.add_argument("--recorded-at", action=_DateTimeAction)
     income_edit.add_argument("--description")
     income_edit.add_argument("--tags", nargs="*")
     income_edit.add_argument("--attachment")
@@ -271,30 +370,120 @@ def build_parser() -> argparse.ArgumentParser:
     income_delete.add_argument("id")
 
     balance_parser = subparsers.add_parser("balance", help="Compute net balance")
-    balance_parser.add_argument("--start", type=_parse_datetime)
-    balance_parser.add_argument("--end", type=_parse_datetime)
+    balance_parser.add_argument("--start", action=_DateTimeAction)
+    balance_parser.add_argument("--end", action=_DateTimeAction)
     balance_parser.add_argument("--category")
     balance_parser.add_argument("--source")
     balance_parser.add_argument("--tag")
 
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run many commands against one load of the data",
+        description=(
+            "Read newline-delimited JSON arrays of command arguments, e.g. "
+            '["expense", "add", "5", "USD", "Food", "cash", "2024-03-01T00:00:00"], '
+            "and run them in order. Data is loaded once and each file is written once at "
+            "the end. Commands before a failing line are kept."
+        ),
+    )
+    batch_parser.add_argument(
+        "file",
+        type=argparse.FileType("r"),
+        help="File of operations, or - for standard input",
+    )
+
     return parser
 
 
+def _command_word(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named by ``argv``, skipping the global ``--data-dir`` option."""
+    words = iter(argv)
+    for word in words:
+        if not word.startswith("-"):
+            return word
+        # argparse accepts unambiguous prefixes; the separate-value form consumes the next word.
+        if "=" not in word and len(word) > 2 and "--data-dir".startswith(word):
+            next(words, None)
+    return None
+
+
+def handle_batch(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    services: Tuple[LedgerService, ExpenseService, IncomeService],
+) -> None:
+    import orjson
+
+    ledger = services[0]
+    # Reading from "-" must not close the process's stdin when the batch ends.
+    source = nullcontext(args.file) if args.file is sys.stdin else args.file
+    # Every command shares the loaded services; storage writes each dirty file once on exit.
+    with source as handle, ledger.bulk():
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                argv = orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                raise ValidationError(f"line {line_number}: malformed JSON") from exc
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise ValidationError(f"line {line_number}: expected a JSON array of strings")
+            # Checked before parsing, which would already open the nested batch file.
+            if _command_word(argv) == "batch":
+                raise ValidationError(f"line {line_number}: batches cannot be nested")
+            try:
+                # Seeding data_dir keeps the outer value unless the line names its own.
+                op_args = parser.parse_args(argv, argparse.Namespace(data_dir=args.data_dir))
+            except SystemExit as exc:
+                if not exc.code:
+                    # -h/--help exits successfully, which must not pass for a completed batch.
+                    raise ValidationError(
+                        f"line {line_number}: help is not available in a batch"
+                    ) from None
+                # argparse already printed the usage error; say which line it came from.
+                print(f"batch stopped at line {line_number}", file=sys.stderr)
+                raise
+            if op_args.data_dir.resolve() != args.data_dir.resolve():
+                raise ValidationError(
+                    f"line {line_number}: --data-dir must match the batch's data directory"
+                )
+            try:
+                _dispatch(op_args, parser, services)
+            except (ValidationError, RecordNotFoundError) as exc:
+                raise type(exc)(f"line {line_number}: {exc}") from exc
+
+
+def _dispatch(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    services: Tuple[LedgerService, ExpenseService, IncomeService],
+) -> None:
+    ledger, expense_service, income_service = services
+    if args.entity == "expense":
+        handle_expense(args, expense_service)
+    elif args.entity == "income":
+        handle_income(args, income_service)
+    elif args.entity == "balance":
+        handle_balance(args, ledger)
+    elif args.entity == "batch":
+        handle_batch(args, parser, services)
+    else:  # pragma: no cover - argparse should prevent this
+        parser.error(f"Unknown entity: {args.entity}")
+
+
+@lru_cache(maxsize=None)
+def _shared_parser() -> argparse.ArgumentParser:
+    # Building the subcommand tree dominates short runs; parse_args keeps no state between calls.
+    return build_parser()
+
+
 def main(argv: Optional[List[str]] = None) -> int:
-    parser = build_parser()
+    parser = _shared_parser()
     args = parser.parse_args(argv)
-    ledger, expense_service, income_service = _load_services(args.data_dir)
+    services = _load_services(args.data_dir)
 
     try:
-        if args.entity == "expense":
-            handle_expense(args, expense_service)
-        elif args.entity == "income":
-            handle_income(args, income_service)
-        elif args.entity == "balance":
-            handle_balance(args, ledger)
-        else:  # pragma: no cover - argparse should prevent this
-            parser.error(f"Unknown entity: {args.entity}")
-            return 2
+        _dispatch(args, parser, services)
     except ValidationError as exc:
         print(f"Validation error: {exc}", file=sys.stderr)
         return 1